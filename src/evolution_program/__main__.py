@@ -0,0 +1,86 @@
+# ahester57
+
+import argparse
+import inspect
+import json
+import sys
+import tomllib
+
+from evolution_program.ga import GA
+from evolution_program.sweep import ResultsWriter, expand_grid, run_sweep
+
+
+# GA arguments that are objects rather than configuration, and so have no flag
+_SKIPPED = ('self', 'instrumentation')
+
+
+def _value(text:str):
+    """Parse a flag value as JSON (numbers, true/false, null), falling back to a plain string."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def _values(text:str):
+    """Parse a comma-separated flag as a list of values to sweep over, or a single value."""
+    values = [_value(v) for v in text.split(',')]
+    return values if len(values) > 1 else values[0]
+
+
+def _seeds(text:str) -> list[int]:
+    """Parse seeds such as '1,2,3' or '1-10'."""
+    seeds = []
+    for part in text.split(','):
+        first, _, last = part.partition('-')
+        seeds.extend(range(int(first), int(last or first) + 1))
+    return seeds
+
+
+def load_config(path:str) -> dict:
+    """Read a sweep configuration from a .toml or .json file."""
+    if path.endswith('.toml'):
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv:list[str]=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m evolution_program',
+        description='Run the GA, or a sweep over a grid of its parameters, without prompts. '
+        'Comma-separated values (or lists in the config file) are swept over.'
+    )
+    parser.add_argument('--config', help='A .toml or .json file of GA arguments. Flags override it.')
+    parser.add_argument('--seeds', type=_seeds, help='Seeds to sweep over, e.g. 1-10 or 1,5,9.')
+    parser.add_argument('--workers', type=int, help='Number of worker processes. Defaults to the CPU count.')
+    parser.add_argument('--output', help='Results file, one row per run: .csv, or else JSON lines. Defaults to standard output.')
+    for name, parameter in inspect.signature(GA.__init__).parameters.items():
+        if name in _SKIPPED:
+            continue
+        flags = ['--' + name.lower().replace('_', '-')]
+        if name == 'Select_Mechanism':
+            flags.append('--mechanisms')
+        if isinstance(parameter.default, dict):
+            parser.add_argument(*flags, dest=name, type=json.loads, help=f'JSON object. Default {parameter.default}.')
+        else:
+            parser.add_argument(*flags, dest=name, type=_values, help=f'Default {getattr(parameter.default, "__name__", parameter.default)}.')
+    args = vars(parser.parse_args(argv))
+    config = load_config(args.pop('config')) if args.get('config') else {}
+    workers, output = args.pop('workers'), args.pop('output')
+    config.update({k: v for k, v in args.items() if v is not None})
+    runs = expand_grid(config)
+    print(f'{len(runs)} runs', file=sys.stderr)
+    writer = ResultsWriter(output)
+    try:
+        for row in run_sweep(runs, workers):
+            writer.write(row)
+            print(f'run {row["run"]}: {row["stop_reason"]} after {row["generations"]} generations, best {row["best_fitness"]:.6g}', file=sys.stderr)
+    finally:
+        writer.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
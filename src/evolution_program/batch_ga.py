@@ -0,0 +1,253 @@
+# ahester57
+
+import numpy as np
+import sys
+
+from collections import deque
+from typing import Callable
+
+import evolution_program.operators as operators
+import evolution_program.test_functions.de_jong_5 as de_jong_5
+from evolution_program.evaluation.evaluator import Evaluator
+from evolution_program.evaluation.serial import SerialEvaluator
+from evolution_program.selection_mechanism.mechanism import SelectionMechanism
+from evolution_program.selection_mechanism.proportional import Proportional
+
+
+class BatchGA:
+    """
+    Many independent runs of a genetic algorithm (GA), advanced in lockstep.
+
+    All runs share one (runs, pop_size, dims) allele tensor and one (runs, pop_size) fitness matrix,
+    so crossover, mutation and batch fitness evaluation are each one NumPy operation per generation.
+    Every run draws from its own random stream, spawned from rand_seed.
+
+    Attributes:
+        runs (int): Number of independent runs. Defaults to 30.
+        dims (int): Dimensions of chromosome vector. Defaults to 3.
+        domain_lower (float): Gene value lower bound. Defaults to -7.0.
+        domain_upper (float): Gene value upper bound. Defaults to 4.0.
+        mutation_standard_deviation (float): Function of upper & lower bounds.
+        pop_size (int): Population size of each run. Defaults to 30.
+        p_c (float): Probability of crossover. In range [0, 1]. Defaults to 0.8.
+        p_m (float): Probability of mutation. In range [0, 1]. Defaults to 0.1.
+        t_max (int): Maximum iterations/generations. Defaults to 50.
+        rand_seed (int): Root seed from which every run's stream is spawned.
+        rngs (list of np.random.Generator): One random stream per run.
+        alleles (np.ndarray of float): The (runs, pop_size, dims) allele tensor.
+        fitnesses (np.ndarray of float): The (runs, pop_size) fitness matrix.
+        history (dict of np.ndarray): Per-generation 'min', 'max' and 'mean' fitness of each run, shaped (t_max + 1, runs).
+        fitness_function (Callable): The "fitness function" or "objective function."
+        maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
+        Select_Mechanism (SelectionMechanism): The selected selection mechanism. Default Proportional.
+        selection_parameters (dict): The selected selection mechanism parameters.
+        mutation_mode (str): 'dense' draws a full mask; 'sparse' draws only mutated positions. Default 'dense'.
+        evaluator (Evaluator): The evaluation backend, built from Evaluator and evaluation_parameters.
+        verbose (bool): Whether to print the seed and periodic statistics. Default True.
+    """
+    def __init__(
+        self,
+        runs:int=30,
+        dims:int=3,
+        domain_lower:float=-7.0,
+        domain_upper:float=4.0,
+        pop_size:int=30,
+        p_c:float=0.8,
+        p_m:float=0.1,
+        t_max:int=50,
+        rand_seed:int=None,
+        fitness_function:Callable=de_jong_5.fn,
+        maximize:bool=True,
+        Select_Mechanism:SelectionMechanism=Proportional,
+        selection_parameters:dict={},
+        mutation_mode:str='dense',
+        Evaluator:Evaluator=SerialEvaluator,
+        evaluation_parameters:dict={},
+        verbose:bool=True
+    ) -> None:
+        """
+        Initialize the parameters shared by every run.
+
+        Args:
+            runs (int, optional): Number of independent runs. Defaults to 30.
+            dims (int, optional): Dimensions of chromosome vector. Defaults to 3.
+            domain_lower (float, optional): Gene value lower bound. Defaults to -7.0.
+            domain_upper (float, optional): Gene value upper bound. Defaults to 4.0.
+            pop_size (int, optional): Population size of each run. Defaults to 30.
+            p_c (float, optional): Probability of crossover. In range [0, 1]. Defaults to 0.8.
+            p_m (float, optional): Probability of mutation. In range [0, 1]. Defaults to 0.1.
+            t_max (int, optional): Maximum iterations/generations. Defaults to 50.
+            rand_seed (int, optional): Root seed for the runs' random streams.
+            fitness_function (Callable, optional): Function of \\vec{x}. Returns (float). Batch functions score all runs in one call.
+            maximize (bool, optional): (False)[minimize]; (True)[maximize]. Default True.
+            Select_Mechanism (SelectionMechanism): The selected selection mechanism. Default Proportional.
+            selection_parameters (dict, optional): The selected selection mechanism parameters.
+            mutation_mode (str, optional): 'dense' or 'sparse'. Prefer 'sparse' for small p_m. Default 'dense'.
+            Evaluator (Evaluator, optional): The evaluation backend. Default SerialEvaluator.
+            evaluation_parameters (dict, optional): The evaluation backend parameters.
+            verbose (bool, optional): Whether to print the seed and periodic statistics. Default True.
+        """
+        assert runs > 0
+        assert dims > 0
+        assert pop_size > 0
+        assert p_c >= 0 and p_c <= 1
+        assert p_m >= 0 and p_m <= 1
+        assert t_max > 0
+        assert fitness_function is not None and callable(fitness_function)
+        assert maximize in (False, True)
+        assert mutation_mode in ('dense', 'sparse')
+        self.runs = int(runs)
+        self.dims = int(dims)
+        self.domain_lower = float(domain_lower)
+        self.domain_upper = float(domain_upper)
+        self.mutation_standard_deviation = (self.domain_upper - self.domain_lower) / 10000 # where divisor is 10**(precision wanted)
+        self.pop_size = int(pop_size)
+        self.p_c = float(p_c)
+        self.p_m = float(p_m)
+        self.t_max = int(t_max)
+        self.t = 0
+        self.alleles = None
+        self.fitnesses = None
+        self.fitness_function = fitness_function
+        self.maximize = maximize
+        self.Select_Mechanism : SelectionMechanism = Select_Mechanism
+        self.selection_parameters = selection_parameters
+        self.mutation_mode = mutation_mode
+        self.evaluator : Evaluator = Evaluator(self.maximize, **evaluation_parameters)
+        self.verbose = verbose
+        self.history = {k: np.full((self.t_max + 1, self.runs), np.nan) for k in ('min', 'max', 'mean')}
+        self.rand_seed = None if rand_seed is None else int(rand_seed)
+        seed_sequence = np.random.SeedSequence(self.rand_seed)
+        self.rand_seed = seed_sequence.entropy
+        self.rngs = [np.random.default_rng(s) for s in seed_sequence.spawn(self.runs)]
+        if self.verbose:
+            print(f'Seeding {self.runs} runs from {self.rand_seed}')
+
+    def simulate(self) -> None:
+        """Simulate every run with configured parameters."""
+        try:
+            self.initialize_population()
+            self.evaluate_population()
+            deque((self.iterate() for _ in np.arange(self.t_max)), maxlen=0) # execute generator
+        finally:
+            self.evaluator.close()
+
+    def iterate(self) -> None:
+        """Perform one iteration of every run."""
+        self.t = self.t + 1
+        if self.t > self.t_max:
+            return
+        self.alleles = self.gene_wise_mutation(self.single_point_crossover(self.selection_mechanism()))
+        self.evaluate_population()
+        if self.verbose and (np.mod(self.t, 10) == 0 or self.t == self.t_max):
+            self.print_stats()
+
+    def selection_mechanism(self) -> np.ndarray[np.float64]:
+        """Perform selection on each run's population.
+
+        Mechanisms with a batched next_populations (tournaments, truncation and 'sus' proportional)
+        select for every run in one pass over the fitness matrix; the rest select one run at a time.
+
+        Returns:
+            np.ndarray of float: The (runs, pop_size, dims) allele tensor of the mating pools.
+        """
+        try:
+            chosen = self.Select_Mechanism.next_populations(self.fitnesses, self.maximize, self.rngs, **self.selection_parameters)
+        except NotImplementedError:
+            chosen = self._select_each_run()
+        return np.take_along_axis(self.alleles, chosen[..., np.newaxis], axis=1)
+
+    def _select_each_run(self) -> np.ndarray[np.signedinteger]:
+        """Perform selection on each run's population with its own mechanism.
+
+        Returns:
+            np.ndarray of int: The (runs, pop_size) matrix of each run's chosen indices.
+        """
+        chosen = np.empty((self.runs, self.pop_size), dtype=np.intp)
+        sums_of_fitnesses = np.sum(self.fitnesses, axis=1)
+        for r in np.arange(self.runs):
+            try:
+                mechanism : SelectionMechanism = self.Select_Mechanism(self.fitnesses[r], sums_of_fitnesses[r], self.maximize, rng=self.rngs[r], **self.selection_parameters)
+            except NotImplementedError:
+                print('Provided Select_Mechanism not supported.')
+                sys.exit(1)
+            chosen[r] = mechanism.next_population()
+        return chosen
+
+    def single_point_crossover(self, population:np.ndarray[np.float64]) -> np.ndarray[np.float64]:
+        """Perform single cut-point crossover on every run using self.p_c as probability of occurrence.
+
+        Args:
+            population (np.ndarray of float): The (runs, pop_size, dims) allele tensor to act upon.
+
+        Returns:
+            np.ndarray of float: A new allele tensor after a round of single cut-point crossover.
+        """
+        n_pairs = self.pop_size // 2
+        if n_pairs == 0 or self.dims < 2:
+            return population.copy()
+        crossed = np.stack([rng.uniform(0, 1, size=n_pairs) <= self.p_c for rng in self.rngs])
+        cut_points = np.stack([rng.integers(1, self.dims, size=n_pairs) for rng in self.rngs])
+        return operators.single_point_crossover(population, crossed, cut_points)
+
+    def gene_wise_mutation(self, population:np.ndarray[np.float64]) -> np.ndarray[np.float64]:
+        """Perform gene-wise mutation on every run using self.p_m as probability of occurrence.
+
+        The allele tensor is mutated in place.
+
+        Args:
+            population (np.ndarray of float): The (runs, pop_size, dims) allele tensor to act upon.
+
+        Returns:
+            np.ndarray of float: The allele tensor after a round of gene-wise mutation.
+        """
+        genes = self.pop_size * self.dims
+        if self.mutation_mode == 'sparse':
+            flat = population.reshape(-1)
+            for r, rng in enumerate(self.rngs):
+                positions = operators.sparse_mutation_positions(self.p_m, genes, rng)
+                flat[r * genes + positions] += rng.normal(0, self.mutation_standard_deviation, size=len(positions))
+            return population
+        shape = population.shape[1:]
+        mask = np.stack([rng.uniform(0, 1, size=shape) <= self.p_m for rng in self.rngs])
+        noise = np.stack([rng.normal(0, self.mutation_standard_deviation, size=shape) for rng in self.rngs])
+        np.add(population, noise, out=population, where=mask)
+        return population
+
+    def evaluate_population(self) -> None:
+        """Evaluate every run's population in one pass over the flattened allele tensor, and record statistics."""
+        flat = self.alleles.reshape(self.runs * self.pop_size, self.dims)
+        self.fitnesses = self.evaluator.evaluate(flat, self.fitness_function).reshape(self.runs, self.pop_size)
+        self.history['min'][self.t] = np.min(self.fitnesses, axis=1)
+        self.history['max'][self.t] = np.max(self.fitnesses, axis=1)
+        self.history['mean'][self.t] = np.mean(self.fitnesses, axis=1)
+
+    def initialize_population(self) -> None:
+        """
+        Initialize every run's population within configured parameters.
+
+        This can only happen when there is no current population.
+        """
+        if self.alleles is not None:
+            raise RuntimeError('Population already initialized')
+        self.alleles = np.stack([
+            rng.uniform(self.domain_lower, self.domain_upper, size=(self.pop_size, self.dims))
+            for rng in self.rngs
+        ])
+
+    @property
+    def best_fitnesses(self) -> np.ndarray[np.float64]:
+        """The best fitness of each run in the current generation."""
+        return self.history['max' if self.maximize else 'min'][self.t]
+
+    def print_stats(self) -> None:
+        best = self.best_fitnesses
+        print(f'----------- Gen. {self.t} ({self.runs} runs) ---------------')
+        print(f'Best  Fitness: {np.max(best) if self.maximize else np.min(best)} (best run)')
+        print(f'Med   Fitness: {np.median(best)} (median of runs\' best)')
+        print(f'Std   Fitness: {np.std(best)} (std of runs\' best)')
+        print(f'Avg   Fitness: {np.mean(self.history["mean"][self.t])}')
+
+
+if __name__ == '__main__':
+    BatchGA(rand_seed=None).simulate()
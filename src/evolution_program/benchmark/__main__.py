@@ -0,0 +1,86 @@
+# ahester57
+
+import argparse
+import json
+import sys
+
+import evolution_program.benchmark.checks as checks
+import evolution_program.benchmark.suite as suite
+from evolution_program.selection_mechanism import MECHANISMS
+
+
+def _ints(text:str) -> list[int]:
+    return [int(float(v)) for v in text.split(',')]
+
+
+def main(argv:list[str]=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m evolution_program.benchmark',
+        description='Benchmark the selection mechanisms for throughput and time-to-target, and the float32 mode for precision, '
+        'and run the correctness checks.'
+    )
+    parser.add_argument('--mechanisms', default=','.join(MECHANISMS), help='Comma-separated mechanisms. Default all.')
+    parser.add_argument('--pop-sizes', type=_ints, default=[10**2, 10**3, 10**4, 10**5, 10**6], help='Comma-separated population sizes. Default 1e2,1e3,1e4,1e5,1e6.')
+    parser.add_argument('--dims', type=_ints, default=[2, 10], help='Comma-separated chromosome dimensions for GA.iterate. Default 2,10.')
+    parser.add_argument('--modes', default='choice,sus,alias', help='Comma-separated proportional sampling modes to time selection with. Default all.')
+    parser.add_argument('--dtypes', default='float64', help='Comma-separated allele dtypes for GA.iterate. Default float64.')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed repetitions of each measurement. Default 3.')
+    parser.add_argument('--problems', default=','.join(suite.PROBLEMS), help='Comma-separated time-to-target problems. Default all.')
+    parser.add_argument('--seeds', type=int, default=10, help='Time-to-target runs per problem and mechanism. Default 10.')
+    parser.add_argument('--sections', default=','.join([*suite.KEYS, 'precision', 'checks']), help='Comma-separated sections to run (selection, iterate, target, precision, checks). Default all.')
+    parser.add_argument('--checks', default=','.join(checks.CHECKS), help=f'Comma-separated correctness checks for the checks section ({", ".join(checks.CHECKS)}). Default all.')
+    parser.add_argument('--output', help='File to write the JSON results to. Defaults to standard output.')
+    parser.add_argument('--compare', metavar='BASELINE', help='Earlier JSON results to compare against; exits 1 on any regression.')
+    parser.add_argument('--precision-tolerance', type=float, default=1e-5, help='Largest relative error of a float32 score allowed by the precision section; exits 1 beyond it. Default 1e-5.')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='Fractional slowdown allowed by --compare. Default 0.1.')
+    args = parser.parse_args(argv)
+    mechanisms = args.mechanisms.split(',')
+    sections = args.sections.split(',')
+    results = {'environment': suite.environment(), 'selection': [], 'iterate': [], 'target': [], 'precision': [], 'checks': []}
+    for mechanism in mechanisms:
+        for pop_size in args.pop_sizes:
+            for mode in (args.modes.split(',') if mechanism == 'proportional' else [None]) if 'selection' in sections else []:
+                results['selection'].append(suite.time_selection(mechanism, pop_size, args.repeats, mode=mode))
+                label = mechanism if mode is None else f'{mechanism} {mode}'
+                print(f'selection {label} {pop_size}: {results["selection"][-1]["seconds"]:.6f}s', file=sys.stderr)
+            for dims in args.dims if 'iterate' in sections else []:
+                for dtype in args.dtypes.split(','):
+                    results['iterate'].append(suite.time_iterate(mechanism, pop_size, dims, args.repeats, dtype=dtype))
+                    print(f'iterate {mechanism} {pop_size}x{dims} {dtype}: {results["iterate"][-1]["seconds"]:.6f}s', file=sys.stderr)
+        for problem in args.problems.split(',') if 'target' in sections else []:
+            results['target'].append(suite.time_to_target(problem, mechanism, list(range(1, args.seeds + 1))))
+            record = results['target'][-1]
+            print(f'target {problem} {mechanism}: {record["reached"]}/{record["runs"]} reached, median {record["median_generations"]} generations', file=sys.stderr)
+    for problem in args.problems.split(',') if 'precision' in sections else []:
+        results['precision'].append(suite.check_precision(problem, list(range(1, args.seeds + 1)), tolerance=args.precision_tolerance))
+        record = results['precision'][-1]
+        flag = 'ok' if record['ok'] else 'IMPRECISE'
+        print(
+            f'precision {problem}: float32 relative error {record["max_relative_error"]:.2e}, '
+            f'{record["runs_agreeing"]}/{record["runs"]} same-seed runs agree {flag}, median best '
+            f'{record["float64_median_best"]:.6g} (float64) vs {record["float32_median_best"]:.6g} (float32)', file=sys.stderr
+        )
+    for check in args.checks.split(',') if 'checks' in sections else []:
+        results['checks'].append(checks.CHECKS[check]())
+        record = results['checks'][-1]
+        print(f'check {check}: {"ok" if record["ok"] else "FAILED"} ' + ', '.join(f'{k} {v}' for k, v in record.items() if k not in ('check', 'ok')), file=sys.stderr)
+    text = json.dumps(results, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    failed = any(not record['ok'] for record in results['precision'] + results['checks'])
+    if args.compare is None:
+        return 1 if failed else 0
+    with open(args.compare) as f:
+        comparisons = suite.compare(json.load(f), results, args.tolerance)
+    for c in comparisons:
+        key = ' '.join(str(v) for k, v in c.items() if k not in ('baseline', 'current', 'ratio', 'regression'))
+        flag = 'REGRESSION' if c['regression'] else 'ok'
+        print(f'{key}: {c["baseline"]:.6f}s -> {c["current"]:.6f}s ({c["ratio"]:.2f}x) {flag}', file=sys.stderr)
+    return 1 if failed or any(c['regression'] for c in comparisons) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,210 @@
+# ahester57
+
+import asyncio
+import numpy as np
+import socket
+import socketserver
+import threading
+import time
+
+import evolution_program.evaluation.protocol as protocol
+from evolution_program.evaluation.asynchronous import AsyncEvaluator
+from evolution_program.evaluation.tcp import TCPEvaluator
+from evolution_program.fitness import batch
+from evolution_program.population import Population
+from evolution_program.selection_mechanism.proportional import Proportional
+from evolution_program.worker import WorkerServer
+
+
+def check_alias_table(cases:int=3000, rand_seed:int=1, tolerance:float=1e-12) -> dict:
+    """Check that proportional selection's alias tables encode exactly the pmf they were built from.
+
+    Small integer fitnesses are used, as their many ties make cumulative surpluses and deficits meet exactly.
+
+    Args:
+        cases (int, optional): Number of random fitness vectors, each tried maximizing and minimizing. Default 3000.
+        rand_seed (int, optional): Seed for the fitness vectors. Default 1.
+        tolerance (float, optional): Largest difference allowed between a slot's implied and given probability. Default 1e-12.
+
+    Returns:
+        dict: The check record; 'ok' is False if any table was off by more than the tolerance.
+    """
+    rng = np.random.default_rng(rand_seed)
+    worst, failures = 0.0, 0
+    for _ in range(cases):
+        fitnesses = rng.integers(1, 5, size=rng.integers(2, 64)).astype(np.float64)
+        for maximize in (True, False):
+            mechanism = Proportional(fitnesses, maximize=maximize, rng=rng, mode='alias')
+            pmf = mechanism._generate_pmf()
+            prob, alias = mechanism._generate_alias_table(pmf)
+            # slot i is drawn with probability 1/n, then keeps i with probability prob[i] or else gives alias[i]
+            implied = prob.copy()
+            np.add.at(implied, alias, 1.0 - prob)
+            error = float(np.max(np.abs(implied / len(pmf) - pmf)))
+            worst = max(worst, error)
+            failures += error > tolerance
+    return {'check': 'alias', 'cases': 2 * cases, 'failures': failures, 'max_error': worst, 'ok': failures == 0}
+
+
+class _StubScoringHandler(socketserver.StreamRequestHandler):
+    """Answers one line of space-separated alleles with their sum, stalling on rows whose first allele is positive."""
+    def handle(self) -> None:
+        x = np.array(self.rfile.readline().split(), dtype=np.float64)
+        if len(x) == 0:
+            return
+        if x[0] > 0:
+            time.sleep(self.server.stall)
+        try:
+            self.wfile.write(f'{float(np.sum(x))!r}\n'.encode('ascii'))
+        except ConnectionError:
+            # the evaluator timed out and hung up
+            pass
+
+
+class _StubScoringServer(socketserver.ThreadingTCPServer):
+    """A local stand-in for a remote scoring service, for exercising the AsyncEvaluator."""
+    daemon_threads = True
+    # room for every concurrent evaluation to connect at once
+    request_queue_size = 128
+
+    def __init__(self, stall:float) -> None:
+        self.stall = stall
+        super().__init__(('127.0.0.1', 0), _StubScoringHandler)
+
+
+class _StubScore:
+    """An `async def` fitness function that asks a _StubScoringServer for each score."""
+    def __init__(self, address:tuple) -> None:
+        self.address = address
+
+    async def __call__(self, alleles:np.ndarray[np.float64]) -> float:
+        reader, writer = await asyncio.open_connection(*self.address)
+        try:
+            writer.write((' '.join(repr(float(a)) for a in alleles) + '\n').encode('ascii'))
+            await writer.drain()
+            return float(await reader.readline())
+        finally:
+            writer.close()
+
+
+def check_async_penalty(rows:int=32, timeout:float=0.2, stall:float=1.0, rand_seed:int=1) -> dict:
+    """Check the AsyncEvaluator against a local stub scoring server that stalls on some rows.
+
+    Rows answered in time must get their true score, and stalled rows must time out and get the penalty:
+    the worst completed score in the direction being optimized, or the configured penalty.
+
+    Args:
+        rows (int, optional): Rows to score. Default 32.
+        timeout (float, optional): Per-call timeout in seconds. Default 0.2.
+        stall (float, optional): Seconds the stub stalls before answering a positive first allele. Default 1.0.
+        rand_seed (int, optional): Seed for the alleles. Default 1.
+
+    Returns:
+        dict: The check record; 'ok' is False if any row got the wrong score.
+    """
+    alleles = np.random.default_rng(rand_seed).uniform(-1, 1, size=(rows, 3))
+    stalled = alleles[:, 0] > 0
+    truth = np.sum(alleles, axis=1)
+    server = _StubScoringServer(stall)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    failures = []
+    try:
+        for maximize, penalty in ((True, None), (False, None), (True, -100.0)):
+            evaluator = AsyncEvaluator(maximize, timeout=timeout, penalty=penalty)
+            population = Population(alleles.copy())
+            population.evaluate(_StubScore(server.server_address), evaluator)
+            worst = np.min(truth[~stalled]) if maximize else np.max(truth[~stalled])
+            expected = np.where(stalled, worst if penalty is None else penalty, truth)
+            if evaluator.timeouts != np.count_nonzero(stalled) or not np.allclose(population.fitnesses, expected, rtol=0, atol=1e-12):
+                failures.append({'maximize': maximize, 'penalty': penalty})
+    finally:
+        server.shutdown()
+        server.server_close()
+    return {'check': 'async', 'rows': rows, 'stalled': int(np.count_nonzero(stalled)), 'failures': failures, 'ok': len(failures) == 0}
+
+
+@batch
+def _slow_sum(alleles:np.ndarray[np.float64]):
+    # slow enough that a worker can be lost part way through an evaluation
+    time.sleep(0.002)
+    return np.sum(alleles, axis=-1)
+
+
+class _DroppableWorker(WorkerServer):
+    """A localhost worker serving this module, whose connections can be cut to simulate losing its machine."""
+    def __init__(self, max_frame:int) -> None:
+        self.connections = []
+        super().__init__('127.0.0.1', 0, modules=(__name__,), max_frame=max_frame)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def process_request(self, request, client_address) -> None:
+        self.connections.append(request)
+        super().process_request(request, client_address)
+
+    def drop(self) -> None:
+        """Cut every connection and stop listening, so coordinators can neither finish nor reconnect."""
+        for connection in self.connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        # shutdown waits out serve_forever's poll interval, so the connections are cut first
+        self.shutdown()
+        self.server_close()
+
+
+def check_tcp_workers(workers:int=3, rows:int=4000, chunk_size:int=20, rand_seed:int=1) -> dict:
+    """Check the TCPEvaluator against several localhost workers, losing one part way through an evaluation.
+
+    Every evaluation must match in-process scoring: before the loss, across it (the lost worker's chunk is
+    requeued for the others), and after it. A worker must also hang up on a frame longer than its limit.
+
+    Args:
+        workers (int, optional): Number of localhost workers. Default 3.
+        rows (int, optional): Rows per evaluation. Default 4000.
+        chunk_size (int, optional): Rows per chunk. Default 20.
+        rand_seed (int, optional): Seed for the alleles. Default 1.
+
+    Returns:
+        dict: The check record; 'ok' is False if any evaluation differed or the oversized frame was accepted.
+    """
+    alleles = np.random.default_rng(rand_seed).uniform(-1, 1, size=(rows, 3))
+    expected = np.sum(alleles, axis=-1)
+    max_frame = 2 * alleles.nbytes
+    servers = [_DroppableWorker(max_frame) for _ in range(workers)]
+    evaluator = TCPEvaluator(True, workers=[s.server_address for s in servers], chunk_size=chunk_size, retries=0, timeout=10)
+    failures = []
+    try:
+        if not np.array_equal(evaluator.evaluate(alleles, _slow_sum), expected):
+            failures.append('before loss')
+        dropping = threading.Timer(0.05, servers[0].drop)
+        dropping.start()
+        if not np.array_equal(evaluator.evaluate(alleles, _slow_sum), expected):
+            failures.append('during loss')
+        dropping.join()
+        if evaluator._workers[0].failures == 0:
+            failures.append('worker not lost')
+        if not np.array_equal(evaluator.evaluate(alleles, _slow_sum), expected):
+            failures.append('after loss')
+        with socket.create_connection(servers[1].server_address, timeout=2) as sock:
+            sock.sendall(protocol.HEADER.pack(protocol.EVALUATE, max_frame + 1))
+            try:
+                if sock.recv(1) != b'':
+                    failures.append('oversized frame answered')
+            except TimeoutError:
+                # still waiting for the payload rather than hanging up
+                failures.append('oversized frame accepted')
+    finally:
+        evaluator.close()
+        for server in servers[1:]:
+            server.shutdown()
+            server.server_close()
+    return {'check': 'tcp', 'workers': workers, 'rows': rows, 'failures': failures, 'ok': len(failures) == 0}
+
+
+# Correctness checks run by the benchmark's 'checks' section
+CHECKS = {
+    'alias': check_alias_table,
+    'async': check_async_penalty,
+    'tcp': check_tcp_workers
+}
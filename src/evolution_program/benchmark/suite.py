@@ -0,0 +1,235 @@
+# ahester57
+
+import numpy as np
+import platform
+import time
+
+import evolution_program.test_functions.de_jong_5 as de_jong_5
+import evolution_program.test_functions.simple as simple
+from evolution_program.ga import GA
+from evolution_program.selection_mechanism import MECHANISMS, default_parameters
+
+
+# Time-to-target problems: GA keyword arguments, and the fitness at which a run has reached its target
+PROBLEMS = {
+    'de_jong_5': ({'fitness_function': de_jong_5.fn, 'dims': 2, 'domain_lower': -65.536, 'domain_upper': 65.536, 'maximize': False}, 1.0),
+    'simple': ({'fitness_function': simple.fn, 'dims': 3, 'domain_lower': -7.0, 'domain_upper': 4.0, 'maximize': False}, 0.05)
+}
+
+
+def _times(run, repeats:int) -> dict[str, float]:
+    """Best and median wall time of `repeats` calls to run(), in seconds."""
+    seconds = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        run()
+        seconds.append(time.perf_counter() - t0)
+    return {'seconds': min(seconds), 'median_seconds': float(np.median(seconds)), 'repeats': repeats}
+
+
+def time_selection(mechanism:str, pop_size:int, repeats:int=5, rand_seed:int=1, mode:str=None) -> dict:
+    """Time one round of selection, constructing the mechanism included, on random positive fitnesses.
+
+    Args:
+        mechanism (str): A key of MECHANISMS.
+        pop_size (int): Population size.
+        repeats (int, optional): Number of timed rounds. Default 5.
+        rand_seed (int, optional): Seed for the fitnesses and the mechanism. Default 1.
+        mode (str, optional): Sampling mode, for mechanisms that have one. Defaults to the mechanism's default.
+
+    Returns:
+        dict: The benchmark record.
+    """
+    Select_Mechanism = MECHANISMS[mechanism]
+    parameters = default_parameters(Select_Mechanism)
+    if mode is not None:
+        parameters['mode'] = mode
+    rng = np.random.default_rng(rand_seed)
+    fitnesses = rng.uniform(1, 100, size=pop_size)
+    total = np.sum(fitnesses)
+    run = lambda: Select_Mechanism(fitnesses, total, True, rng=rng, **parameters).next_population()
+    run()
+    return {'mechanism': mechanism, 'mode': parameters.get('mode'), 'pop_size': pop_size, **_times(run, repeats)}
+
+
+def time_iterate(mechanism:str, pop_size:int, dims:int, repeats:int=3, rand_seed:int=1, dtype:str='float64') -> dict:
+    """Time one full generation (GA.iterate) on the simple function.
+
+    Args:
+        mechanism (str): A key of MECHANISMS.
+        pop_size (int): Population size.
+        dims (int): Dimensions of chromosome vector.
+        repeats (int, optional): Number of timed generations. Default 3.
+        rand_seed (int, optional): Seed for the GA. Default 1.
+        dtype (str, optional): Allele dtype, 'float64' or 'float32'. Default 'float64'.
+
+    Returns:
+        dict: The benchmark record.
+    """
+    Select_Mechanism = MECHANISMS[mechanism]
+    ga = GA(
+        dims=dims, pop_size=pop_size, t_max=repeats + 1, rand_seed=rand_seed, fitness_function=simple.fn, maximize=False,
+        Select_Mechanism=Select_Mechanism, selection_parameters=default_parameters(Select_Mechanism), dtype=dtype, verbose=False
+    )
+    ga.initialize_population()
+    ga.evaluate_population()
+    ga.iterate()
+    return {'mechanism': mechanism, 'pop_size': pop_size, 'dims': dims, 'dtype': dtype, **_times(ga.iterate, repeats)}
+
+
+def time_to_target(problem:str, mechanism:str, seeds:list[int], pop_size:int=100, t_max:int=500) -> dict:
+    """Run the GA on a problem from several seeds, recording the generations and wall time taken to reach its target.
+
+    Args:
+        problem (str): A key of PROBLEMS.
+        mechanism (str): A key of MECHANISMS.
+        seeds (list of int): One run per seed.
+        pop_size (int, optional): Population size. Default 100.
+        t_max (int, optional): Generations after which a run gives up. Default 500.
+
+    Returns:
+        dict: The benchmark record, with medians over the runs that reached the target.
+    """
+    parameters, target = PROBLEMS[problem]
+    Select_Mechanism = MECHANISMS[mechanism]
+    generations, seconds = [], []
+    for seed in seeds:
+        ga = GA(
+            pop_size=pop_size, t_max=t_max, rand_seed=seed, Select_Mechanism=Select_Mechanism,
+            selection_parameters=default_parameters(Select_Mechanism), verbose=False, **parameters
+        )
+        t0 = time.perf_counter()
+        ga.initialize_population()
+        ga.evaluate_population()
+        while ga.t < ga.t_max and not _reached(ga, target):
+            ga.iterate()
+        if _reached(ga, target):
+            generations.append(ga.t)
+            seconds.append(time.perf_counter() - t0)
+    return {
+        'problem': problem,
+        'mechanism': mechanism,
+        'target': target,
+        'runs': len(seeds),
+        'reached': len(generations),
+        'median_generations': float(np.median(generations)) if len(generations) > 0 else None,
+        'median_seconds': float(np.median(seconds)) if len(seconds) > 0 else None
+    }
+
+
+def check_precision(
+    problem:str, seeds:list[int], pop_size:int=100, t_max:int=100, samples:int=10**5, tolerance:float=1e-5,
+    run_tolerance:float=1e-4, agreement:float=0.5
+) -> dict:
+    """Check the float32 population mode against float64 on a problem.
+
+    The fitness function is scored in float32 and in float64 on the same random float32 points of the domain.
+    Then the GA is run to t_max from each seed in both dtypes. Both dtypes consume the same random stream, so
+    a seed's two runs track each other to within float32 rounding, and their best fitness and summary
+    statistics (min, max, mean and quartiles) must agree to run_tolerance. Rounding can still tip a near-tie
+    in selection and send the pair of runs apart for good, so only a fraction, agreement, of the pairs must
+    agree; a float32 fault in selection, mutation or the statistics parts nearly every pair.
+
+    Args:
+        problem (str): A key of PROBLEMS.
+        seeds (list of int): One run per seed and dtype.
+        pop_size (int, optional): Population size. Default 100.
+        t_max (int, optional): Generations per run. Default 100.
+        samples (int, optional): Number of points scored in both dtypes. Default 1e5.
+        tolerance (float, optional): Largest relative error of a float32 score allowed. Default 1e-5.
+        run_tolerance (float, optional): Largest relative difference between a seed's float32 and float64
+            statistics for the pair to agree. Default 1e-4.
+        agreement (float, optional): Fraction of same-seed pairs that must agree. Default 0.5.
+
+    Returns:
+        dict: The benchmark record; 'ok' is False if any float32 score was off by more than tolerance,
+            or if fewer than agreement of the same-seed runs agreed.
+    """
+    parameters, target = PROBLEMS[problem]
+    fitness_function = parameters['fitness_function']
+    rng = np.random.default_rng(seeds[0])
+    points = rng.uniform(parameters['domain_lower'], parameters['domain_upper'], size=(samples, parameters['dims'])).astype(np.float32)
+    exact = fitness_function(points.astype(np.float64))
+    error = float(np.max(np.abs(fitness_function(points) - exact) / np.maximum(np.abs(exact), np.finfo(np.float64).tiny)))
+    summaries = {}
+    for dtype in ('float64', 'float32'):
+        summaries[dtype] = []
+        for seed in seeds:
+            ga = GA(pop_size=pop_size, t_max=t_max, rand_seed=seed, dtype=dtype, verbose=False, **parameters)
+            ga.simulate()
+            stats = ga.population.statistics
+            summaries[dtype].append((stats.max if ga.maximize else stats.min, stats.min, stats.max, stats.mean, *stats.quantiles))
+    float64, float32 = np.array(summaries['float64']), np.array(summaries['float32'])
+    deviations = np.max(np.abs(float32 - float64) / np.maximum(np.abs(float64), np.finfo(np.float64).tiny), axis=1)
+    agreeing = int(np.sum(deviations <= run_tolerance))
+    record = {
+        'problem': problem, 'runs': len(seeds), 'max_relative_error': error,
+        'runs_agreeing': agreeing, 'median_run_deviation': float(np.median(deviations)),
+        'ok': error <= tolerance and agreeing >= agreement * len(seeds)
+    }
+    for dtype, summary in (('float64', float64), ('float32', float32)):
+        best = summary[:, 0]
+        record[f'{dtype}_median_best'] = float(np.median(best))
+        record[f'{dtype}_reached'] = int(np.sum(best >= target if ga.maximize else best <= target))
+    return record
+
+
+def _reached(ga:GA, target:float) -> bool:
+    stats = ga.population.statistics
+    return stats.max >= target if ga.maximize else stats.min <= target
+
+
+def environment() -> dict:
+    """Where the benchmark ran, so results from different machines are not compared by mistake."""
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z')
+    }
+
+
+# Which records are matched up by compare, and the timing compared for each
+KEYS = {
+    'selection': (('mechanism', 'mode', 'pop_size'), 'seconds'),
+    'iterate': (('mechanism', 'pop_size', 'dims', 'dtype'), 'seconds'),
+    'target': (('problem', 'mechanism'), 'median_seconds')
+}
+
+# Values of key fields missing from results written before the field was added
+_KEY_DEFAULTS = {'dtype': 'float64'}
+
+
+def compare(baseline:dict, current:dict, tolerance:float=0.1) -> list[dict]:
+    """Match up the records of two benchmark results and flag those that got slower.
+
+    Args:
+        baseline (dict): Earlier benchmark output.
+        current (dict): Later benchmark output.
+        tolerance (float, optional): Fractional slowdown allowed before a record is a regression. Default 0.1.
+
+    Returns:
+        list of dict: One comparison per record present in both, with the ratio current / baseline.
+    """
+    comparisons = []
+    for section, (fields, metric) in KEYS.items():
+        before = {_key(r, fields): r for r in baseline.get(section, [])}
+        for record in current.get(section, []):
+            key = _key(record, fields)
+            if key not in before or before[key][metric] is None or record[metric] is None:
+                continue
+            ratio = record[metric] / before[key][metric]
+            comparisons.append({
+                'section': section,
+                **dict(zip(fields, key)),
+                'baseline': before[key][metric],
+                'current': record[metric],
+                'ratio': ratio,
+                'regression': ratio > 1 + tolerance
+            })
+    return comparisons
+
+
+def _key(record:dict, fields:tuple[str]) -> tuple:
+    return tuple(record.get(f, _KEY_DEFAULTS.get(f)) for f in fields)
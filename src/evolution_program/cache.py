@@ -0,0 +1,102 @@
+# ahester57
+
+import numpy as np
+
+from collections import OrderedDict
+
+
+class FitnessCache:
+    """A bounded least-recently-used memo of fitness scores keyed on allele values.
+
+    Keys are the exact allele bytes, or, when a precision is given, the alleles rounded
+    onto a grid of that spacing, so near-identical individuals share a score.
+
+    Attributes:
+        max_entries (int): Maximum number of scores held before the least recently used is evicted.
+        precision (float): Grid spacing for quantized keys. None keys on exact bytes.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups not found in the cache.
+    """
+    def __init__(self, max_entries:int, precision:float=None) -> None:
+        """Initialize an empty fitness cache.
+
+        Args:
+            max_entries (int): Maximum number of scores held.
+            precision (float, optional): Grid spacing for quantized keys. Defaults to exact keys.
+        """
+        assert max_entries > 0
+        assert precision is None or precision > 0
+        self.max_entries = int(max_entries)
+        self.precision = None if precision is None else float(precision)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def lookup(self, alleles:np.ndarray[np.float64]) -> tuple[np.ndarray]:
+        """Look up cached scores for each row of an allele matrix.
+
+        Args:
+            alleles (np.ndarray of float): The (n, dims) allele matrix.
+
+        Returns:
+            tuple of np.ndarray: The (n,) scores, and the (n,) mask of rows that were found.
+        """
+        scores = np.zeros(len(alleles), dtype=np.float64)
+        found = np.zeros(len(alleles), dtype=bool)
+        for i, key in enumerate(self._keys(alleles)):
+            score = self._entries.get(key)
+            if score is None:
+                continue
+            self._entries.move_to_end(key)
+            scores[i] = score
+            found[i] = True
+        hits = int(np.count_nonzero(found))
+        self.hits += hits
+        self.misses += len(alleles) - hits
+        return scores, found
+
+    def store(self, alleles:np.ndarray[np.float64], scores:np.ndarray[np.float64]) -> None:
+        """Remember the scores of each row of an allele matrix, evicting the least recently used as needed.
+
+        Args:
+            alleles (np.ndarray of float): The (n, dims) allele matrix.
+            scores (np.ndarray of float): The (n,) fitness scores.
+        """
+        for key, score in zip(self._keys(alleles), scores):
+            self._entries[key] = score
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _keys(self, alleles:np.ndarray[np.float64]) -> list[bytes]:
+        if self.precision is not None:
+            alleles = np.rint(alleles / self.precision).astype(np.int64)
+        return [row.tobytes() for row in np.ascontiguousarray(alleles)]
+
+    def to_arrays(self) -> tuple[np.ndarray]:
+        """Export the entries, least recently used first, e.g. for a checkpoint.
+
+        Returns:
+            tuple of np.ndarray: The (entries, key bytes) uint8 key matrix and the (entries,) scores.
+            An empty cache exports a (0, 0) key matrix, as its key length is unknown.
+        """
+        if len(self._entries) == 0:
+            return np.empty((0, 0), dtype=np.uint8), np.empty(0, dtype=np.float64)
+        keys = np.frombuffer(b''.join(self._entries.keys()), dtype=np.uint8)
+        return keys.reshape(len(self._entries), -1), np.fromiter(self._entries.values(), dtype=np.float64, count=len(self._entries))
+
+    def restore(self, keys:np.ndarray[np.uint8], scores:np.ndarray[np.float64]) -> None:
+        """Replace the entries with ones exported by to_arrays.
+
+        Args:
+            keys (np.ndarray of uint8): The (entries, key bytes) key matrix, (0, 0) for no entries.
+            scores (np.ndarray of float): The (entries,) scores.
+        """
+        assert len(keys) == len(scores)
+        self._entries = OrderedDict(zip((row.tobytes() for row in keys), scores))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def report(self) -> str:
+        return f'Cache Hits: {self.hits}, Misses: {self.misses}, Entries: {len(self)}/{self.max_entries}'
@@ -0,0 +1,164 @@
+# ahester57
+
+import json
+import numpy as np
+import os
+import threading
+
+import evolution_program.references as references
+
+
+def snapshot(ga) -> dict[str, np.ndarray]:
+    """Capture everything needed to continue a GA bit-identically from its current generation.
+
+    Arrays are copied, so the GA may keep running while the snapshot is written.
+
+    Args:
+        ga (GA): An evaluated GA.
+
+    Returns:
+        dict of np.ndarray: The arrays of a checkpoint file.
+    """
+    assert ga.population is not None and ga.population.is_evaluated
+    config = {
+        'dims': ga.dims,
+        'domain_lower': ga.domain_lower,
+        'domain_upper': ga.domain_upper,
+        'pop_size': ga.pop_size,
+        'p_c': ga.p_c,
+        'p_m': ga.p_m,
+        't_max': ga.t_max,
+        'rand_seed': ga.rand_seed,
+        'fitness_function': references.reference(ga.fitness_function),
+        'maximize': ga.maximize,
+        'Select_Mechanism': references.reference(ga.Select_Mechanism),
+        'selection_parameters': ga.selection_parameters,
+        'mutation_mode': ga.mutation_mode,
+        'Evaluator': references.reference(type(ga.evaluator)),
+        'evaluation_parameters': ga.evaluation_parameters,
+        'cache_size': 0 if ga.cache is None else ga.cache.max_entries,
+        'cache_precision': None if ga.cache is None else ga.cache.precision,
+        'bit_generator': ga.bit_generator,
+        'checkpoint_interval': ga.checkpoint_interval,
+        'history_path': ga.history_path,
+        'history_snapshots': ga.history_snapshots,
+        'target_fitness': ga.target_fitness,
+        'stagnation_generations': ga.stagnation_generations,
+        'diversity_threshold': ga.diversity_threshold,
+        'time_budget': ga.time_budget,
+        'max_evaluations': ga.max_evaluations,
+        'deduplicate': ga.deduplicate,
+        'elitism': ga.elitism,
+        'offspring_per_step': ga.offspring_per_step,
+        'replacement': ga.replacement,
+        'pipeline_depth': ga.pipeline_depth,
+        'dtype': ga.dtype.name
+    }
+    arrays = {
+        't': np.array(ga.t),
+        'alleles': ga.population.alleles.copy(),
+        'fitnesses': ga.population.fitnesses.copy(),
+        'config': np.array(json.dumps(config)),
+        'rng_state': np.array(json.dumps(ga.rng.bit_generator.state, default=np.ndarray.tolist)),
+        'children_spawned': np.array(ga.seed_sequence.n_children_spawned),
+        'evaluations': np.array(ga.evaluations),
+        'best_fitness': np.array(ga._best_fitness),
+        'stagnant': np.array(ga._stagnant)
+    }
+    if ga.cache is not None:
+        arrays['cache_keys'], arrays['cache_scores'] = ga.cache.to_arrays()
+    return arrays
+
+
+def save(path:str, arrays:dict[str, np.ndarray]) -> None:
+    """Write a checkpoint atomically: to a temporary file beside `path`, then renamed over it.
+
+    Args:
+        path (str): Destination .npz file.
+        arrays (dict of np.ndarray): A snapshot.
+    """
+    temporary = f'{path}.tmp'
+    with open(temporary, 'wb') as f:
+        np.savez(f, **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+def load(path:str) -> dict:
+    """Read a checkpoint written by save.
+
+    Args:
+        path (str): The .npz file.
+
+    Returns:
+        dict: 't', 'alleles', 'fitnesses', 'children_spawned', 'evaluations', 'best_fitness', 'stagnant'
+        and optional 'cache_keys' and 'cache_scores' arrays,
+        with 'config' and 'rng_state' decoded to dicts.
+    """
+    with np.load(path, allow_pickle=False) as f:
+        arrays = {k: f[k] for k in f.files}
+    arrays['config'] = json.loads(str(arrays['config']))
+    arrays['rng_state'] = json.loads(str(arrays['rng_state']))
+    return arrays
+
+
+class CheckpointWriter:
+    """Saves snapshots on a background thread so that checkpointing does not stall the generation loop.
+
+    Only the latest snapshot matters: one submitted while another is still waiting replaces it.
+
+    Attributes:
+        path (str): Destination .npz file, overwritten by each checkpoint.
+        written (int): Number of checkpoints written.
+    """
+    def __init__(self, path:str) -> None:
+        """Start a checkpoint writer.
+
+        Args:
+            path (str): Destination .npz file.
+        """
+        assert path is not None and len(path) > 0
+        self.path = path
+        self.written = 0
+        self._pending = None
+        self._closed = False
+        self._error = None
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='checkpoint-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, arrays:dict[str, np.ndarray]) -> None:
+        """Queue a snapshot to be written, replacing any still waiting.
+
+        Args:
+            arrays (dict of np.ndarray): A snapshot.
+        """
+        with self._condition:
+            if self._error is not None:
+                raise self._error
+            self._pending = arrays
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                arrays, self._pending = self._pending, None
+            try:
+                save(self.path, arrays)
+                self.written += 1
+            except Exception as e:
+                self._error = e
+
+    def close(self) -> None:
+        """Write any waiting snapshot and stop the writer thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
@@ -8,20 +8,31 @@ from typing import Callable
 class Chromosome:
     """Depicts one individual in the population.
 
+    A Chromosome is a lightweight view onto one row of a Population's allele matrix
+    and one slot of its fitness vector. A standalone Chromosome owns its own storage.
+
     Attributes:
-        alleles (tuple of float): Individual chromosome's values.
+        alleles (np.ndarray of float): Individual chromosome's values.
         fitness_score (float): The fitness score
     """
+    __slots__ = ('alleles', '_fitnesses', '_index')
 
-    def __init__(self, alleles:np.ndarray[np.float64]) -> None:
+    def __init__(self, alleles:np.ndarray[np.float64], fitnesses:np.ndarray[np.float64]=None, index:int=0) -> None:
         """Depicts one individual in the population.
 
         Args:
-            alleles (tuple of float): Individual chromosome's values.
+            alleles (np.ndarray of float): Individual chromosome's values.
+            fitnesses (np.ndarray of float, optional): Backing fitness vector, when a view into a Population.
+            index (int, optional): This individual's slot in the backing fitness vector.
         """
         assert alleles is not None and type(alleles) is np.ndarray
         self.alleles = alleles
-        self.fitness_score = None
+        if fitnesses is None:
+            self._fitnesses = np.full(1, np.nan, dtype=np.float64)
+            self._index = 0
+        else:
+            self._fitnesses = fitnesses
+            self._index = int(index)
 
     def evaluate(self, fitness_function:Callable) -> None:
         """Perform an evaluation of this chromosome with given fitness function.
@@ -37,12 +48,15 @@ class Chromosome:
 
     @property
     def fitness_score(self) -> np.float64:
-        return self._fitness_score
+        value = self._fitnesses[self._index]
+        if np.isnan(value):
+            return None
+        return value
 
     @fitness_score.setter
     def fitness_score(self, value:np.float64) -> None:
-        assert value is None or type(value) is np.float64
-        self._fitness_score = value
+        assert value is None or isinstance(value, np.floating)
+        self._fitnesses[self._index] = np.nan if value is None else value
 
     @property
     def is_evaluated(self) -> bool:
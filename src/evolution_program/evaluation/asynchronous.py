@@ -0,0 +1,104 @@
+# ahester57
+
+import asyncio
+import numpy as np
+import time
+
+from typing import Callable
+
+from evolution_program.evaluation.evaluator import Evaluator
+
+
+class AsyncEvaluator(Evaluator):
+    """Evaluates an `async def` fitness function with bounded concurrency on an asyncio event loop.
+
+    Suited to I/O-bound fitness functions, e.g. ones that query a scoring service or wait on a subprocess.
+    Calls that exceed the timeout are cancelled and assigned the penalty fitness.
+
+    Attributes:
+        maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
+        concurrency (int): Maximum number of evaluations in flight.
+        timeout (float): Per-call timeout in seconds. 0 disables the timeout.
+        penalty (float): Fitness assigned to timed-out calls. None (or NaN) uses the worst score of the batch.
+        timeouts (int): Total number of timed-out calls.
+    """
+    def __init__(self, maximize:bool=True, **kwargs) -> None:
+        """Initialize an asyncio evaluator.
+
+        Args:
+            maximize (bool, optional): (False)[minimize]; (True)[maximize]. Default True.
+            concurrency (int, optional): Maximum number of evaluations in flight. Defaults to 16.
+            timeout (float, optional): Per-call timeout in seconds. Defaults to 0 (no timeout).
+            penalty (float, optional): Fitness assigned to timed-out calls. Defaults to the worst score of the batch, as does NaN.
+        """
+        concurrency = int(kwargs.get('concurrency') or 16)
+        timeout = float(kwargs.get('timeout') or 0)
+        assert concurrency > 0
+        assert timeout >= 0
+        self.maximize = maximize
+        self.concurrency = concurrency
+        self.timeout = timeout
+        penalty = kwargs.get('penalty')
+        self.penalty = None if penalty is None or np.isnan(float(penalty)) else float(penalty)
+        self.timeouts = 0
+        self._last = None
+
+    def evaluate(self, alleles:np.ndarray[np.float64], fitness_function:Callable) -> np.ndarray[np.float64]:
+        """Score every row of an allele matrix on a fresh event loop.
+
+        Args:
+            alleles (np.ndarray of float): The (n, dims) allele matrix to score.
+            fitness_function (Callable): An `async def` function of \\vec{x}. Returns (float).
+
+        Returns:
+            np.ndarray of float: The (n,) fitness vector.
+        """
+        assert fitness_function is not None and callable(fitness_function)
+        t0 = time.perf_counter()
+        scores, timed_out = asyncio.run(self._evaluate_all(alleles, fitness_function))
+        if np.any(timed_out):
+            scores[timed_out] = self._penalty_for(scores[~timed_out])
+        self.timeouts += int(np.count_nonzero(timed_out))
+        self._last = (len(alleles), int(np.count_nonzero(timed_out)), time.perf_counter() - t0)
+        return scores
+
+    async def _evaluate_all(self, alleles:np.ndarray[np.float64], fitness_function:Callable) -> tuple[np.ndarray]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        scores = np.zeros(len(alleles), dtype=np.float64)
+        timed_out = np.zeros(len(alleles), dtype=bool)
+
+        async def evaluate_one(i:int) -> None:
+            async with semaphore:
+                try:
+                    if self.timeout > 0:
+                        scores[i] = await asyncio.wait_for(fitness_function(alleles[i]), self.timeout)
+                    else:
+                        scores[i] = await fitness_function(alleles[i])
+                except asyncio.TimeoutError:
+                    timed_out[i] = True
+
+        await asyncio.gather(*(evaluate_one(i) for i in range(len(alleles))))
+        return scores, timed_out
+
+    def _penalty_for(self, completed:np.ndarray[np.float64]) -> float:
+        """The configured penalty, or else the worst finite score among the completed calls."""
+        if self.penalty is not None:
+            return self.penalty
+        completed = completed[np.isfinite(completed)]
+        if len(completed) == 0:
+            return 0.0
+        return np.min(completed) if self.maximize else np.max(completed)
+
+    def report(self) -> str:
+        if self._last is None:
+            return ''
+        calls, timeouts, seconds = self._last
+        return f'Eval  Async: {calls} calls in {seconds:.4f}s at concurrency {self.concurrency}; {timeouts} timed out'
+
+    @staticmethod
+    def parameters() -> dict[str, tuple]:
+        return {
+            'concurrency': ('Enter Maximum Concurrent Evaluations', 16),
+            'timeout': ('Enter Per-Call Timeout in Seconds (0 for none)', 0.0),
+            'penalty': ('Enter Fitness of Timed-Out Calls (nan for the worst of the batch)', float('nan'))
+        }
@@ -0,0 +1,39 @@
+# ahester57
+
+import numpy as np
+
+from concurrent.futures import Future
+from typing import Callable
+
+
+class Evaluator:
+    def __init__(self, maximize:bool=True, **kwargs) -> None:
+        raise NotImplementedError
+
+    def evaluate(self, alleles:np.ndarray[np.float64], fitness_function:Callable) -> np.ndarray[np.float64]:
+        raise NotImplementedError
+
+    def submit(self, alleles:np.ndarray[np.float64], fitness_function:Callable) -> Future:
+        """Start scoring an allele matrix, returning a Future of its (n,) fitness vector.
+
+        Backends that can evaluate in the background override this; by default the evaluation
+        happens now and the Future is already done.
+        """
+        future = Future()
+        try:
+            future.set_result(self.evaluate(alleles, fitness_function))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def report(self) -> str:
+        """Summary of the last evaluation, for display. Empty if there is nothing to report."""
+        return ''
+
+    def close(self) -> None:
+        """Release any workers or shared resources held by this evaluator."""
+        pass
+
+    @staticmethod
+    def parameters() -> dict[str, tuple]:
+        raise NotImplementedError
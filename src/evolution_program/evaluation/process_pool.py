@@ -0,0 +1,188 @@
+# ahester57
+
+import numpy as np
+import os
+import time
+
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable
+
+import evolution_program.fitness as fitness
+from evolution_program.evaluation.evaluator import Evaluator
+
+
+# Shared memory block most recently attached by this worker process, reused across tasks
+_attached : SharedMemory = None
+
+
+def _attach(name:str) -> SharedMemory:
+    """Attach to the coordinator's shared memory block from a worker process."""
+    global _attached
+    if _attached is not None and _attached.name == name:
+        return _attached
+    if _attached is not None:
+        _attached.close()
+    _attached = SharedMemory(name=name)
+    return _attached
+
+
+def _views(buffer, n:int, dims:int, dtype:str) -> tuple[np.ndarray]:
+    """The allele matrix and, after it on an 8-byte boundary, the float64 fitness vector in a shared memory buffer."""
+    alleles = np.ndarray((n, dims), dtype=dtype, buffer=buffer)
+    offset = -(-alleles.nbytes // 8) * 8
+    return alleles, np.ndarray((n,), dtype=np.float64, buffer=buffer, offset=offset)
+
+
+def _size(n:int, dims:int, dtype:str) -> int:
+    """Bytes of shared memory needed by _views."""
+    return -(-n * dims * np.dtype(dtype).itemsize // 8) * 8 + n * np.dtype(np.float64).itemsize
+
+
+def _evaluate_chunk(name:str, n:int, dims:int, dtype:str, start:int, stop:int, fitness_function:Callable) -> float:
+    """Score rows [start, stop) of the shared allele matrix, writing into the shared fitness vector.
+
+    Args:
+        name (str): Name of the shared memory block.
+        n (int): Number of rows in the shared allele matrix.
+        dims (int): Number of columns in the shared allele matrix.
+        dtype (str): Data type of the shared allele matrix, e.g. 'float64'.
+        start (int): First row of the chunk.
+        stop (int): One past the last row of the chunk.
+        fitness_function (Callable): The "fitness function" or "objective function."
+
+    Returns:
+        float: Seconds spent evaluating this chunk.
+    """
+    t0 = time.perf_counter()
+    shm = _attach(name)
+    alleles, fitnesses = _views(shm.buf, n, dims, dtype)
+    fitnesses[start:stop] = fitness.evaluate(fitness_function, alleles[start:stop])
+    return time.perf_counter() - t0
+
+
+class ProcessPoolEvaluator(Evaluator):
+    """Fans fitness evaluation out across a pool of worker processes.
+
+    The allele matrix and fitness vector live in one shared memory block, so workers read alleles
+    and write fitnesses in place. Only chunk bounds and the fitness function reference are pickled,
+    so the fitness function must be importable (e.g. defined at module level).
+
+    Attributes:
+        workers (int): Number of worker processes.
+        chunk_size (int): Rows per task. 0 picks about four chunks per worker.
+        timings (list of dict): Per-generation timing breakdown, in seconds.
+    """
+    def __init__(self, maximize:bool=True, **kwargs) -> None:
+        """Initialize a process pool evaluator. The pool is started on first use.
+
+        Args:
+            maximize (bool, optional): (False)[minimize]; (True)[maximize]. Default True.
+            workers (int, optional): Number of worker processes. Defaults to the CPU count.
+            chunk_size (int, optional): Rows per task. Defaults to 0 (automatic).
+        """
+        workers = int(kwargs.get('workers') or os.cpu_count() or 1)
+        chunk_size = int(kwargs.get('chunk_size') or 0)
+        assert workers > 0
+        assert chunk_size >= 0
+        self.maximize = maximize
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.timings = []
+        self._executor = None
+        self._shm = None
+
+    def evaluate(self, alleles:np.ndarray[np.float64], fitness_function:Callable) -> np.ndarray[np.float64]:
+        """Score every row of an allele matrix across the worker pool.
+
+        Args:
+            alleles (np.ndarray of float): The (n, dims) allele matrix to score.
+            fitness_function (Callable): The "fitness function" or "objective function."
+
+        Returns:
+            np.ndarray of float: The (n,) fitness vector.
+        """
+        assert fitness_function is not None and callable(fitness_function)
+        t0 = time.perf_counter()
+        n, dims = alleles.shape
+        dtype = fitness.as_float_array(alleles).dtype.name
+        shared_alleles, shared_fitnesses = self._shared_arrays(n, dims, dtype)
+        shared_alleles[:] = alleles
+        t1 = time.perf_counter()
+        chunk_size = self.chunk_size or max(1, -(-n // (self.workers * 4)))
+        futures = [
+            self._pool().submit(_evaluate_chunk, self._shm.name, n, dims, dtype, start, min(start + chunk_size, n), fitness_function)
+            for start in range(0, n, chunk_size)
+        ]
+        wait(futures)
+        chunk_seconds = [f.result() for f in futures]
+        t2 = time.perf_counter()
+        result = shared_fitnesses.copy()
+        t3 = time.perf_counter()
+        self.timings.append({
+            'scatter': t1 - t0,
+            'compute': t2 - t1,
+            'gather': t3 - t2,
+            'total': t3 - t0,
+            'chunks': len(chunk_seconds),
+            'chunk_max': max(chunk_seconds, default=0.0),
+            'chunk_sum': sum(chunk_seconds)
+        })
+        return result
+
+    def submit(self, alleles:np.ndarray[np.float64], fitness_function:Callable) -> Future:
+        """Score an allele matrix on one worker in the background, e.g. a steady-state batch of offspring.
+
+        The batch is pickled to the worker rather than placed in shared memory, so several may be in flight at once.
+
+        Args:
+            alleles (np.ndarray of float): The (n, dims) allele matrix to score.
+            fitness_function (Callable): The "fitness function" or "objective function."
+
+        Returns:
+            Future: Resolves to the (n,) fitness vector.
+        """
+        assert fitness_function is not None and callable(fitness_function)
+        return self._pool().submit(fitness.evaluate, fitness_function, np.array(alleles))
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _shared_arrays(self, n:int, dims:int, dtype:str) -> tuple[np.ndarray]:
+        """Views onto the shared allele matrix and fitness vector, reallocating the block if it is too small."""
+        size = _size(n, dims, dtype)
+        if self._shm is None or self._shm.size < size:
+            self._release_shared_memory()
+            self._shm = SharedMemory(create=True, size=size)
+        return _views(self._shm.buf, n, dims, dtype)
+
+    def _release_shared_memory(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def report(self) -> str:
+        if len(self.timings) == 0:
+            return ''
+        last = self.timings[-1]
+        return (
+            f'Eval  Timing: {last["total"]:.4f}s '
+            f'(scatter {last["scatter"]:.4f}s, compute {last["compute"]:.4f}s, gather {last["gather"]:.4f}s; '
+            f'{last["chunks"]} chunks, max {last["chunk_max"]:.4f}s, sum {last["chunk_sum"]:.4f}s)'
+        )
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._release_shared_memory()
+
+    @staticmethod
+    def parameters() -> dict[str, tuple]:
+        return {
+            'workers': ('Enter Number of Worker Processes', os.cpu_count() or 1),
+            'chunk_size': ('Enter Rows per Task (0 for automatic)', 0)
+        }
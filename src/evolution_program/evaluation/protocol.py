@@ -0,0 +1,83 @@
+# ahester57
+
+import numpy as np
+import socket
+import struct
+
+
+# Every frame is a one-byte kind and an unsigned 64-bit payload length, network byte order
+HEADER = struct.Struct('!cQ')
+# An EVALUATE payload starts with rows, dims and the allele dtype code ('d' float64 or 'f' float32)
+MATRIX = struct.Struct('!IIc')
+# A RESULT payload starts with rows; fitnesses follow as little-endian float64
+VECTOR = struct.Struct('!I')
+
+HELLO = b'H'    # payload: utf-8 'module:qualname' of the fitness function
+OK = b'K'       # payload: empty
+EVALUATE = b'E' # payload: MATRIX header, then rows * dims little-endian floats
+RESULT = b'R'   # payload: VECTOR header, then rows little-endian float64
+ERROR = b'X'    # payload: utf-8 message
+
+_DTYPES = {b'd': np.dtype('<f8'), b'f': np.dtype('<f4')}
+_CODES = {np.dtype(np.float64): b'd', np.dtype(np.float32): b'f'}
+
+
+def send_frame(sock:socket.socket, kind:bytes, payload:bytes=b'') -> None:
+    """Write one frame. The header and payload go out in one gathered write, without concatenating them."""
+    buffers = [HEADER.pack(kind, len(payload)), payload]
+    sent = sock.sendmsg(buffers)
+    total = HEADER.size + len(payload)
+    if sent < total:
+        sock.sendall(b''.join(buffers)[sent:])
+
+
+def recv_frame(sock:socket.socket, max_length:int=None) -> tuple[bytes, bytes]:
+    """Read one frame.
+
+    Args:
+        sock (socket.socket): The connection.
+        max_length (int, optional): Largest payload accepted, checked before anything is allocated for it. Defaults to no limit.
+
+    Returns:
+        tuple of bytes: The frame kind and its payload.
+
+    Raises:
+        ConnectionError: If the peer closed the connection, or sent a payload longer than max_length.
+    """
+    kind, length = HEADER.unpack(_recv_exactly(sock, HEADER.size))
+    if max_length is not None and length > max_length:
+        raise ConnectionError(f'{length}-byte frame exceeds the {max_length}-byte limit')
+    return kind, _recv_exactly(sock, length)
+
+
+def _recv_exactly(sock:socket.socket, n:int) -> bytes:
+    buffer = bytearray(n)
+    view = memoryview(buffer)
+    received = 0
+    while received < n:
+        count = sock.recv_into(view[received:], n - received)
+        if count == 0:
+            raise ConnectionError('connection closed by peer')
+        received += count
+    return bytes(buffer)
+
+
+def pack_matrix(alleles:np.ndarray) -> bytes:
+    """Encode an allele matrix as a raw buffer, without pickling."""
+    dtype = np.dtype(alleles.dtype)
+    return MATRIX.pack(alleles.shape[0], alleles.shape[1], _CODES[dtype]) + np.ascontiguousarray(alleles, dtype=dtype.newbyteorder('<')).tobytes()
+
+
+def unpack_matrix(payload:bytes) -> np.ndarray:
+    rows, dims, code = MATRIX.unpack_from(payload)
+    return np.frombuffer(payload, dtype=_DTYPES[code], count=rows * dims, offset=MATRIX.size).reshape(rows, dims)
+
+
+def pack_vector(fitnesses:np.ndarray) -> bytes:
+    """Encode a fitness vector as raw little-endian float64."""
+    return VECTOR.pack(len(fitnesses)) + np.ascontiguousarray(fitnesses, dtype='<f8').tobytes()
+
+
+def unpack_vector(payload:bytes) -> np.ndarray:
+    (rows,) = VECTOR.unpack_from(payload)
+    return np.frombuffer(payload, dtype='<f8', count=rows, offset=VECTOR.size)
@@ -0,0 +1,30 @@
+# ahester57
+
+import numpy as np
+
+from typing import Callable
+
+import evolution_program.fitness as fitness
+from evolution_program.evaluation.evaluator import Evaluator
+
+
+class SerialEvaluator(Evaluator):
+    """Evaluates fitness in the calling process, one batch call or one call per row."""
+    def __init__(self, maximize:bool=True, **kwargs) -> None:
+        self.maximize = maximize
+
+    def evaluate(self, alleles:np.ndarray[np.float64], fitness_function:Callable) -> np.ndarray[np.float64]:
+        """Score every row of an allele matrix in this process.
+
+        Args:
+            alleles (np.ndarray of float): The (n, dims) allele matrix to score.
+            fitness_function (Callable): The "fitness function" or "objective function."
+
+        Returns:
+            np.ndarray of float: The (n,) fitness vector.
+        """
+        return fitness.evaluate(fitness_function, alleles)
+
+    @staticmethod
+    def parameters() -> dict[str, tuple]:
+        return {}
@@ -0,0 +1,218 @@
+# ahester57
+
+import numpy as np
+import queue
+import socket
+import threading
+import time
+
+from typing import Callable
+
+import evolution_program.evaluation.protocol as protocol
+import evolution_program.references as references
+from evolution_program.evaluation.evaluator import Evaluator
+
+
+class WorkerError(RuntimeError):
+    """Raised when a worker reports that the fitness function failed."""
+
+
+class _Worker:
+    """Connection to one remote worker, and its throughput since the evaluator started."""
+    __slots__ = ('address', 'sock', 'function', 'failures', 'rows', 'chunks', 'seconds')
+
+    def __init__(self, address:tuple[str, int]) -> None:
+        self.address = address
+        self.sock : socket.socket = None
+        self.function = None
+        self.failures = 0
+        self.rows = 0
+        self.chunks = 0
+        self.seconds = 0.0
+
+    def connect(self, function:str, timeout:float) -> None:
+        """Open the connection if needed, and announce the fitness function if it changed."""
+        if self.sock is None:
+            self.sock = socket.create_connection(self.address, timeout=timeout or None)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.function = None
+        if self.function != function:
+            protocol.send_frame(self.sock, protocol.HELLO, function.encode('utf-8'))
+            kind, payload = protocol.recv_frame(self.sock)
+            if kind == protocol.ERROR:
+                raise WorkerError(f'{self.name}: {payload.decode("utf-8")}')
+            self.function = function
+
+    def evaluate(self, alleles:np.ndarray) -> np.ndarray[np.float64]:
+        t0 = time.perf_counter()
+        protocol.send_frame(self.sock, protocol.EVALUATE, protocol.pack_matrix(alleles))
+        kind, payload = protocol.recv_frame(self.sock)
+        if kind == protocol.ERROR:
+            raise WorkerError(f'{self.name}: {payload.decode("utf-8")}')
+        scores = protocol.unpack_vector(payload)
+        assert len(scores) == len(alleles)
+        self.rows += len(alleles)
+        self.chunks += 1
+        self.seconds += time.perf_counter() - t0
+        return scores
+
+    def disconnect(self) -> None:
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    @property
+    def name(self) -> str:
+        return f'{self.address[0]}:{self.address[1]}'
+
+
+class TCPEvaluator(Evaluator):
+    """Fans fitness evaluation out to worker processes on other machines over TCP.
+
+    Start a worker on each machine with `python -m evolution_program.worker --host 0.0.0.0 --port 5555 --allow my_package`,
+    on a trusted network: workers do not authenticate coordinators, and only serve fitness functions from the allowed modules.
+    Alleles and fitnesses cross the wire as raw buffers in a small binary framing (see protocol),
+    and the fitness function is sent as a 'module:qualname' reference, so it must be importable on every worker.
+    Chunks are pulled from a shared queue by one thread per worker, so faster workers take more of them;
+    a chunk held by a worker whose connection drops goes back on the queue for the others.
+
+    Attributes:
+        workers (list of tuple): (host, port) address of each worker.
+        chunk_size (int): Rows per chunk. 0 picks about four chunks per worker.
+        retries (int): Times a lost worker is reconnected, at the start of later evaluations, before it is dropped.
+        timeout (float): Socket timeout in seconds. 0 disables the timeout.
+    """
+    def __init__(self, maximize:bool=True, **kwargs) -> None:
+        """Initialize a TCP evaluator. Workers are connected on first use.
+
+        Args:
+            maximize (bool, optional): (False)[minimize]; (True)[maximize]. Default True.
+            workers (str or list, optional): Worker addresses, as 'host:port,host:port' or a list of them. Default 'localhost:5555'.
+            chunk_size (int, optional): Rows per chunk. Defaults to 0 (automatic).
+            retries (int, optional): Reconnection attempts per lost worker. Defaults to 3.
+            timeout (float, optional): Socket timeout in seconds. Defaults to 60.
+        """
+        workers = kwargs.get('workers') or 'localhost:5555'
+        if isinstance(workers, str):
+            workers = workers.split(',')
+        chunk_size = int(kwargs.get('chunk_size') or 0)
+        retries = int(kwargs.get('retries', 3))
+        timeout = float(kwargs.get('timeout', 60))
+        assert len(workers) > 0
+        assert chunk_size >= 0
+        assert retries >= 0
+        assert timeout >= 0
+        self.maximize = maximize
+        self.workers = [self._address(w) for w in workers]
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.timeout = timeout
+        self._workers = [_Worker(address) for address in self.workers]
+        self._last = None
+
+    @staticmethod
+    def _address(worker) -> tuple[str, int]:
+        if isinstance(worker, str):
+            host, _, port = worker.strip().rpartition(':')
+            return (host or 'localhost', int(port))
+        host, port = worker
+        return (host, int(port))
+
+    def evaluate(self, alleles:np.ndarray[np.float64], fitness_function:Callable) -> np.ndarray[np.float64]:
+        """Score every row of an allele matrix across the remote workers.
+
+        Args:
+            alleles (np.ndarray of float): The (n, dims) allele matrix to score.
+            fitness_function (Callable): An importable "fitness function" or "objective function."
+
+        Returns:
+            np.ndarray of float: The (n,) fitness vector.
+        """
+        assert fitness_function is not None and callable(fitness_function)
+        t0 = time.perf_counter()
+        function = references.reference(fitness_function)
+        n = len(alleles)
+        scores = np.empty(n, dtype=np.float64)
+        live = [w for w in self._workers if w.failures <= self.retries]
+        chunk_size = self.chunk_size or max(1, -(-n // (max(len(live), 1) * 4)))
+        chunks = queue.Queue()
+        for start in range(0, n, chunk_size):
+            chunks.put((start, min(start + chunk_size, n)))
+        state = {'remaining': chunks.qsize(), 'lost': 0, 'error': None}
+        lock = threading.Lock()
+        threads = [
+            threading.Thread(target=self._serve, args=(w, function, alleles, scores, chunks, state, lock, len(live)), daemon=True)
+            for w in live
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if state['error'] is not None:
+            raise state['error']
+        if state['remaining'] > 0:
+            raise ConnectionError(f'all workers lost with {state["remaining"]} chunks unevaluated')
+        self._last = (n, len(live) - state['lost'], time.perf_counter() - t0)
+        return scores
+
+    def _serve(self, worker:_Worker, function:str, alleles:np.ndarray, scores:np.ndarray, chunks:queue.Queue, state:dict, lock:threading.Lock, live:int) -> None:
+        """Pull chunks for one worker until none remain, the worker is lost, or another worker failed the fitness function."""
+        try:
+            worker.connect(function, self.timeout)
+        except OSError:
+            self._lose(worker, state, lock)
+            return
+        except WorkerError as e:
+            state['error'] = e
+            return
+        while state['error'] is None:
+            with lock:
+                if state['remaining'] == 0 or state['lost'] == live:
+                    return
+            try:
+                start, stop = chunks.get(timeout=0.01)
+            except queue.Empty:
+                # a chunk may yet be returned by a lost worker
+                continue
+            try:
+                scores[start:stop] = worker.evaluate(alleles[start:stop])
+            except OSError:
+                chunks.put((start, stop))
+                self._lose(worker, state, lock)
+                return
+            except WorkerError as e:
+                state['error'] = e
+                return
+            with lock:
+                state['remaining'] -= 1
+
+    @staticmethod
+    def _lose(worker:_Worker, state:dict, lock:threading.Lock) -> None:
+        worker.disconnect()
+        worker.failures += 1
+        with lock:
+            state['lost'] += 1
+
+    def report(self) -> str:
+        if self._last is None:
+            return ''
+        rows, workers, seconds = self._last
+        throughput = ', '.join(
+            f'{w.name} {w.rows / w.seconds if w.seconds > 0 else 0.0:.0f} rows/s over {w.chunks} chunks'
+            + ('' if w.failures == 0 else f' ({w.failures} lost)')
+            for w in self._workers
+        )
+        return f'Eval  TCP: {rows} rows in {seconds:.4f}s on {workers} workers; {throughput}'
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.disconnect()
+
+    @staticmethod
+    def parameters() -> dict[str, tuple]:
+        return {
+            'workers': ('Enter Worker Addresses (host:port,host:port)', 'localhost:5555'),
+            'chunk_size': ('Enter Rows per Chunk (0 for automatic)', 0),
+            'retries': ('Enter Reconnection Attempts per Lost Worker', 3),
+            'timeout': ('Enter Socket Timeout in Seconds (0 for none)', 60.0)
+        }
@@ -0,0 +1,83 @@
+# ahester57
+
+import inspect
+import numpy as np
+
+from typing import Callable
+
+
+# Allele dtypes a population may be stored in; anything else is converted to float64
+DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+def batch(fitness_function:Callable) -> Callable:
+    """Declare that a fitness function accepts a (n, dims) allele matrix and returns a (n,) fitness vector.
+
+    Batch fitness functions should still accept a single (dims,) allele vector and return a scalar,
+    so that they remain usable with Chromosome.evaluate.
+
+    Args:
+        fitness_function (Callable): The "fitness function" or "objective function."
+
+    Returns:
+        Callable: The same function, marked as batch-capable.
+    """
+    assert fitness_function is not None and callable(fitness_function)
+    fitness_function.batch = True
+    return fitness_function
+
+
+def is_batch(fitness_function:Callable) -> bool:
+    """Whether the given fitness function was declared with @batch.
+
+    Args:
+        fitness_function (Callable): The "fitness function" or "objective function."
+
+    Returns:
+        bool: True if the function evaluates whole allele matrices.
+    """
+    return getattr(fitness_function, 'batch', False) is True
+
+
+def is_async(fitness_function:Callable) -> bool:
+    """Whether the given fitness function is an `async def` coroutine function.
+
+    Args:
+        fitness_function (Callable): The "fitness function" or "objective function."
+
+    Returns:
+        bool: True if calling the function returns an awaitable to be run on an event loop.
+    """
+    return inspect.iscoroutinefunction(fitness_function) or inspect.iscoroutinefunction(getattr(fitness_function, '__call__', None))
+
+
+def as_float_array(alleles) -> np.ndarray:
+    """View alleles as an array of one of DTYPES, keeping float32 input in float32.
+
+    Args:
+        alleles (array-like): An allele vector or matrix.
+
+    Returns:
+        np.ndarray of float: The alleles, converted to float64 unless already float32 or float64.
+    """
+    x = np.asarray(alleles)
+    return x if x.dtype in DTYPES else x.astype(np.float64)
+
+
+def evaluate(fitness_function:Callable, alleles:np.ndarray[np.float64]) -> np.ndarray[np.float64]:
+    """Score every row of an allele matrix.
+
+    Batch fitness functions are called once with the whole matrix; other callables once per row.
+
+    Args:
+        fitness_function (Callable): The "fitness function" or "objective function."
+        alleles (np.ndarray of float): The (n, dims) allele matrix to score.
+
+    Returns:
+        np.ndarray of float: The (n,) fitness vector.
+    """
+    assert fitness_function is not None and callable(fitness_function)
+    assert not is_async(fitness_function), 'async fitness functions require an AsyncEvaluator'
+    if is_batch(fitness_function):
+        return np.asarray(fitness_function(alleles), dtype=np.float64)
+    return np.fromiter((fitness_function(row) for row in alleles), dtype=np.float64, count=len(alleles))
@@ -7,8 +7,18 @@ import time
 from collections import deque
 from typing import Callable
 
+import evolution_program.checkpoint as checkpoint
+import evolution_program.fitness as fitness
+import evolution_program.references as references
+import evolution_program.operators as operators
 import evolution_program.test_functions.de_jong_5 as de_jong_5
-from evolution_program.chromosome import Chromosome
+from evolution_program.cache import FitnessCache
+from evolution_program.evaluation.asynchronous import AsyncEvaluator
+from evolution_program.evaluation.evaluator import Evaluator
+from evolution_program.evaluation.serial import SerialEvaluator
+from evolution_program.heap import IndexedHeap
+from evolution_program.history import HistoryRecorder
+from evolution_program.instrumentation import NULL_STAGE, Instrumentation
 from evolution_program.population import Population
 from evolution_program.selection_mechanism.mechanism import SelectionMechanism
 from evolution_program.selection_mechanism.proportional import Proportional
@@ -28,11 +38,37 @@ class GA:
         p_m (float): Probability of mutation. In range [0, 1]. Defaults to 0.1.
         t_max (int): Maximum iterations/generations. Defaults to 50.
         rand_seed (int): Seed given to RNG calculated from parameters.
+        seed_sequence (np.random.SeedSequence): Root of this GA's random streams, from which child streams are spawned.
+        rng (np.random.Generator): This GA's own source of randomness.
         population (Population): Collection of current generation's individual chromosomes.
         fitness_function (Callable): The "fitness function" or "objective function."
         maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
         Select_Mechanism (SelectionMechanism): The selected selection mechanism. Default Proportional.
         selection_parameters (dict): The selected selection mechanism parameters.
+        mutation_mode (str): 'dense' draws a full mask; 'sparse' draws only mutated positions. Default 'dense'.
+        evaluator (Evaluator): The evaluation backend, built from Evaluator and evaluation_parameters.
+        evaluation_parameters (dict): The evaluation backend parameters.
+        cache (FitnessCache): Memo of fitness scores, or None when caching is off.
+        bit_generator (str): Kind of random stream, 'PCG64' or 'Philox'.
+        checkpoint_path (str): File that checkpoints are written to, or None when checkpointing is off.
+        checkpoint_interval (int): Generations between checkpoints.
+        history_path (str): Directory that per-generation history is recorded to, or None when recording is off.
+        history_snapshots (bool): Whether the history keeps every generation's population too.
+        instrumentation (Instrumentation): Per-stage timers, counters and hooks, or None when off.
+        target_fitness (float): Stop once the best fitness reaches this. None disables.
+        stagnation_generations (int): Stop after this many generations without improving the best fitness. 0 disables.
+        diversity_threshold (float): Stop once the mean per-gene allele variance falls below this. None disables.
+        time_budget (float): Stop after this many seconds of simulate. None disables.
+        max_evaluations (int): Stop once this many fitness function calls have been made. None disables.
+        deduplicate (bool): Whether bit-identical individuals in a generation are evaluated once.
+        elitism (int): Number of fittest individuals carried unchanged, with their known fitness, into each generation.
+        offspring_per_step (int): Steady-state mode: offspring (lambda) bred, evaluated and inserted per step. 0 is generational.
+        replacement (str): Steady-state mode: who each offspring replaces, 'worst' or a binary 'tournament' loser.
+        pipeline_depth (int): Steady-state mode: offspring batches left evaluating on the evaluator while the next is bred.
+        dtype (np.dtype): Allele dtype, float64 or the compact float32. Fitness scores are always float64.
+        evaluations (int): Fitness function calls made so far.
+        stop_reason (str): Why simulate stopped: 't_max' or the name of the criterion met. None before it stops.
+        verbose (bool): Whether to print the seed and periodic statistics. Default True.
     """
     def __init__(
         self,
@@ -47,7 +83,30 @@ class GA:
         fitness_function:Callable=de_jong_5.fn,
         maximize:bool=True,
         Select_Mechanism:SelectionMechanism=Proportional,
-        selection_parameters:dict={}
+        selection_parameters:dict={},
+        mutation_mode:str='dense',
+        Evaluator:Evaluator=SerialEvaluator,
+        evaluation_parameters:dict={},
+        cache_size:int=0,
+        cache_precision:float=None,
+        bit_generator:str='PCG64',
+        checkpoint_path:str=None,
+        checkpoint_interval:int=10,
+        history_path:str=None,
+        history_snapshots:bool=False,
+        instrumentation:Instrumentation=None,
+        target_fitness:float=None,
+        stagnation_generations:int=0,
+        diversity_threshold:float=None,
+        time_budget:float=None,
+        max_evaluations:int=None,
+        deduplicate:bool=False,
+        elitism:int=0,
+        offspring_per_step:int=0,
+        replacement:str='worst',
+        pipeline_depth:int=0,
+        dtype:str='float64',
+        verbose:bool=True
     ) -> None:
         """
         Initialize the parameters for a genetic algorithm.
@@ -65,6 +124,32 @@ class GA:
             maximize (bool, optional): (False)[minimize]; (True)[maximize]. Default True.
             Select_Mechanism (SelectionMechanism): The selected selection mechanism. Default Proportional.
             selection_parameters (dict, optional): The selected selection mechanism parameters.
+            mutation_mode (str, optional): 'dense' or 'sparse'. Prefer 'sparse' for small p_m. Default 'dense'.
+            Evaluator (Evaluator, optional): The evaluation backend. Default SerialEvaluator, or AsyncEvaluator for `async def` fitness functions.
+            evaluation_parameters (dict, optional): The evaluation backend parameters.
+            cache_size (int, optional): Maximum entries in the fitness cache. 0 disables caching. Default 0.
+            cache_precision (float, optional): Grid spacing for cache keys. Defaults to exact allele values.
+            bit_generator (str, optional): 'PCG64' or 'Philox'. Default 'PCG64'.
+            checkpoint_path (str, optional): .npz file to checkpoint to, in the background. Defaults to no checkpointing.
+            checkpoint_interval (int, optional): Generations between checkpoints. Default 10.
+            history_path (str, optional): Directory to record per-generation statistics to (see load_history). Defaults to no recording.
+            history_snapshots (bool, optional): Also record every generation's alleles and fitnesses. Default False.
+            instrumentation (Instrumentation, optional): Times each stage and calls its hooks; summarized when simulate ends. Defaults to off.
+            target_fitness (float, optional): Stop once the best fitness reaches this. Defaults to none.
+            stagnation_generations (int, optional): Stop after this many generations without improvement. Default 0 (off).
+            diversity_threshold (float, optional): Stop once the mean per-gene allele variance falls below this. Defaults to none.
+            time_budget (float, optional): Stop after this many seconds. Defaults to none.
+            max_evaluations (int, optional): Stop once this many fitness function calls have been made. Defaults to none.
+            deduplicate (bool, optional): Evaluate each distinct individual of a generation once. Default False.
+            elitism (int, optional): Number of fittest individuals carried into each generation without re-evaluation. Default 0.
+            offspring_per_step (int, optional): Run steady-state, breeding this many offspring per step; each iteration
+                is pop_size / offspring_per_step steps. Default 0 (generational).
+            replacement (str, optional): 'worst' or 'tournament'. Default 'worst'.
+            pipeline_depth (int, optional): Offspring batches submitted to the evaluator ahead of insertion. Cached scores are
+                not used for pipelined batches. Default 0 (evaluate each batch before breeding the next).
+            dtype (str, optional): 'float64' or 'float32'. float32 halves the population's memory and bandwidth, and batch
+                fitness functions that keep their input's dtype compute in float32, at about 7 significant digits. Default 'float64'.
+            verbose (bool, optional): Whether to print the seed and periodic statistics. Default True.
         """
         assert dims > 0
         assert pop_size > 0
@@ -73,6 +158,19 @@ class GA:
         assert t_max > 0
         assert fitness_function is not None and callable(fitness_function)
         assert maximize in (False, True)
+        assert mutation_mode in ('dense', 'sparse')
+        assert cache_size >= 0
+        assert bit_generator in ('PCG64', 'Philox')
+        assert checkpoint_interval > 0
+        assert stagnation_generations >= 0
+        assert diversity_threshold is None or diversity_threshold >= 0
+        assert time_budget is None or time_budget > 0
+        assert max_evaluations is None or max_evaluations > 0
+        assert elitism >= 0 and elitism < pop_size
+        assert offspring_per_step >= 0 and offspring_per_step <= pop_size
+        assert replacement in ('worst', 'tournament')
+        assert pipeline_depth >= 0
+        assert np.dtype(dtype) in fitness.DTYPES
         self.dims = int(dims)
         self.domain_lower = float(domain_lower)
         self.domain_upper = float(domain_upper)
@@ -87,97 +185,359 @@ class GA:
         self.maximize = maximize
         self.Select_Mechanism : SelectionMechanism = Select_Mechanism
         self.selection_parameters = selection_parameters
+        self.mutation_mode = mutation_mode
+        if fitness.is_async(fitness_function) and Evaluator is SerialEvaluator:
+            Evaluator = AsyncEvaluator
+        self.evaluation_parameters = evaluation_parameters
+        self.evaluator : Evaluator = Evaluator(self.maximize, **evaluation_parameters)
+        self.cache = FitnessCache(cache_size, cache_precision) if cache_size > 0 else None
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = int(checkpoint_interval)
+        self._checkpoints = None
+        self.history_path = history_path
+        self.history_snapshots = history_snapshots
+        self._history = None
+        self.instrumentation = instrumentation
+        self.target_fitness = target_fitness
+        self.stagnation_generations = int(stagnation_generations)
+        self.diversity_threshold = diversity_threshold
+        self.time_budget = time_budget
+        self.max_evaluations = max_evaluations
+        self.deduplicate = deduplicate
+        self.elitism = int(elitism)
+        self.offspring_per_step = int(offspring_per_step)
+        self.replacement = replacement
+        self.pipeline_depth = int(pipeline_depth)
+        self.dtype = np.dtype(dtype)
+        self.evaluations = 0
+        self.stop_reason = None
+        self._best_fitness = None
+        self._stagnant = 0
+        self._started = None
+        self.verbose = verbose
+        self.bit_generator = bit_generator
         self.rand_seed = None
-        self.seed_random(rand_seed)
+        self.seed_random(rand_seed, bit_generator)
 
     def simulate(self) -> None:
-        """Simulate the genetic algorithm with configured parameters."""
-        self.initialize_population()
-        self.evaluate_population()
-        deque((self.iterate() for _ in np.arange(self.t_max)), maxlen=0) # execute generator
+        """Simulate the genetic algorithm with configured parameters, continuing from generation t if resumed.
+
+        Runs until t_max, or until one of the early termination criteria is met; see stop_reason.
+        """
+        self._started = time.perf_counter()
+        self.stop_reason = None
+        if self.history_path is not None:
+            self._history = HistoryRecorder(
+                self.history_path, self.t_max, self.pop_size, self.dims, self.history_snapshots,
+                # generations up to the checkpointed one were recorded before it was written
+                recorded=self.t + 1 if self.t > 0 else 0, dtype=self.dtype
+            )
+        try:
+            if self.population is None:
+                self.initialize_population()
+                self.evaluate_population()
+            while self.stop_reason is None:
+                self.stop_reason = self.should_stop()
+                if self.stop_reason is None:
+                    self.iterate()
+            if self.stop_reason != 't_max':
+                if self.verbose:
+                    self.print_stats()
+                    print(f'Stopped early: {self.stop_reason}')
+                if self.checkpoint_path is not None:
+                    self.write_checkpoint()
+        finally:
+            self.evaluator.close()
+            if self._checkpoints is not None:
+                self._checkpoints.close()
+                self._checkpoints = None
+            if self._history is not None:
+                self._history.close()
+                self._history = None
+            if self.instrumentation is not None and self.verbose:
+                print(self.instrumentation.summary())
+
+    @classmethod
+    def resume(cls, path:str, **kwargs) -> 'GA':
+        """Rebuild a GA from a checkpoint, ready to simulate the remaining generations.
+
+        The continued run is bit-identical to one that was never interrupted. The fitness function,
+        selection mechanism and evaluator are re-imported by name, so they must be importable.
+
+        Args:
+            path (str): A checkpoint written with checkpoint_path.
+            **kwargs: GA parameters overriding the checkpointed ones, e.g. a larger t_max.
+                Checkpointing continues to `path` unless checkpoint_path is given.
+
+        Returns:
+            GA: The GA at the checkpointed generation.
+        """
+        saved = checkpoint.load(path)
+        config = saved['config']
+        for key in ('fitness_function', 'Select_Mechanism', 'Evaluator'):
+            config[key] = references.resolve(config[key])
+        ga = cls(**{**config, 'checkpoint_path': path, **kwargs})
+        ga.t = int(saved['t'])
+        ga.population = Population(saved['alleles'], saved['fitnesses'])
+        ga.rng.bit_generator.state = saved['rng_state']
+        ga.seed_sequence = np.random.SeedSequence(ga.rand_seed, n_children_spawned=int(saved['children_spawned']))
+        ga.evaluations = int(saved['evaluations'])
+        ga._best_fitness, ga._stagnant = float(saved['best_fitness']), int(saved['stagnant'])
+        if ga.cache is not None and 'cache_keys' in saved:
+            ga.cache.restore(saved['cache_keys'], saved['cache_scores'])
+        return ga
 
     def iterate(self) -> None:
         """Perform one iteration of the simulation."""
         self.t = self.t + 1
         if self.t > self.t_max:
             return
-        self.population = self.create_next_population()
-        self.evaluate_population()
-        if np.mod(self.t, 10) == 0 or self.t == self.t_max:
+        if self.offspring_per_step > 0:
+            self.steady_state_steps()
+        else:
+            self.population = self.create_next_population()
+            self.evaluate_population()
+        if self.verbose and (np.mod(self.t, 10) == 0 or self.t == self.t_max):
             self.print_stats()
+        if self.checkpoint_path is not None and (np.mod(self.t, self.checkpoint_interval) == 0 or self.t == self.t_max):
+            self.write_checkpoint()
+
+    def should_stop(self) -> str:
+        """Check the termination criteria against the current, evaluated generation.
+
+        Returns:
+            str: The name of the first criterion met ('target_fitness', 'max_evaluations', 'stagnation_generations',
+            'diversity_threshold', 'time_budget' or 't_max'), or None to keep going.
+        """
+        stats = self.population.statistics
+        best = stats.max if self.maximize else stats.min
+        if self.target_fitness is not None and (best >= self.target_fitness if self.maximize else best <= self.target_fitness):
+            return 'target_fitness'
+        if self.max_evaluations is not None and self.evaluations >= self.max_evaluations:
+            return 'max_evaluations'
+        if self.stagnation_generations > 0 and self._stagnant >= self.stagnation_generations:
+            return 'stagnation_generations'
+        if self.diversity_threshold is not None and np.mean(np.var(self.population.alleles, axis=0)) < self.diversity_threshold:
+            return 'diversity_threshold'
+        if self.time_budget is not None and self._started is not None and time.perf_counter() - self._started >= self.time_budget:
+            return 'time_budget'
+        if self.t >= self.t_max:
+            return 't_max'
+        return None
 
-    def create_next_population(self) -> Population:
+    def _track_progress(self) -> None:
+        """Count evaluations and generations since the best fitness last improved."""
+        self.evaluations += self.population.evaluations
+        stats = self.population.statistics
+        best = stats.max if self.maximize else stats.min
+        if self._best_fitness is None or (best > self._best_fitness if self.maximize else best < self._best_fitness):
+            self._best_fitness = best
+            self._stagnant = 0
+        else:
+            self._stagnant += 1
+
+    def steady_state_steps(self) -> None:
+        """Replace the population in place, offspring_per_step individuals at a time, over pop_size / offspring_per_step steps.
+
+        Each step breeds a small batch of offspring from the current population, evaluates only those,
+        and overwrites the worst individuals (kept in an indexed heap, so each is found in O(log pop_size))
+        or the losers of binary tournaments. With a pipeline_depth, batches are submitted to the evaluator
+        and each is inserted pipeline_depth steps after it was bred, so breeding overlaps evaluation with no
+        generation barrier while the run still depends only on its seed, not on when evaluations finish.
+        """
+        size = self.offspring_per_step
+        # heap of the least fit on top
+        worst = IndexedHeap(self.population.fitnesses, reverse=not self.maximize) if self.replacement == 'worst' else None
+        in_flight = deque()
+        evaluations = 0
+        for _ in np.arange(-(-self.pop_size // size)):
+            offspring = self.create_next_population(size)
+            if self.pipeline_depth == 0:
+                hits = 0 if self.cache is None else self.cache.hits
+                with self._stage('evaluation'):
+                    offspring.evaluate(self.fitness_function, self.evaluator, self.cache, self.deduplicate)
+                if self.instrumentation is not None:
+                    self.instrumentation.count('evaluations', offspring.evaluations)
+                    self.instrumentation.count('duplicates', offspring.duplicates)
+                    self.instrumentation.count('cache_hits', 0 if self.cache is None else self.cache.hits - hits)
+                evaluations += offspring.evaluations
+                self._insert(offspring.alleles, offspring.fitnesses, worst)
+                continue
+            in_flight.append((offspring.alleles, self.evaluator.submit(offspring.alleles, self.fitness_function)))
+            # never insert early just because a batch happens to be done, or insertion order would depend on timing
+            if len(in_flight) > self.pipeline_depth:
+                evaluations += self._insert_completed(in_flight.popleft(), worst)
+        while len(in_flight) > 0:
+            evaluations += self._insert_completed(in_flight.popleft(), worst)
+        self.population.evaluations = evaluations
+        self._record_generation()
+
+    def _insert_completed(self, batch:tuple, worst:IndexedHeap) -> int:
+        """Wait for a pipelined (alleles, Future) batch and insert it, returning its number of evaluations."""
+        alleles, future = batch
+        with self._stage('evaluation'):
+            fitnesses = future.result()
+        if self.instrumentation is not None:
+            self.instrumentation.count('evaluations', len(alleles))
+        self._insert(alleles, fitnesses, worst)
+        return len(alleles)
+
+    def _insert(self, alleles:np.ndarray[np.float64], fitnesses:np.ndarray[np.float64], worst:IndexedHeap) -> None:
+        """Overwrite the worst individuals (or binary tournament losers) with evaluated offspring."""
+        if worst is not None:
+            victims = np.empty(len(alleles), dtype=np.intp)
+            for i, score in enumerate(fitnesses.tolist()):
+                victims[i] = worst.top()
+                worst.update(victims[i], score)
+        else:
+            contestants = self.rng.integers(0, self.pop_size, size=(len(alleles), 2))
+            scores = self.population.fitnesses[contestants]
+            loser = np.argmin(scores, axis=1) if self.maximize else np.argmax(scores, axis=1)
+            victims = contestants[np.arange(len(contestants)), loser]
+        # an individual replaced twice in one batch keeps the later offspring
+        _, last = np.unique(victims[::-1], return_index=True)
+        keep = len(victims) - 1 - last
+        self.population.replace(victims[keep], alleles[keep], fitnesses[keep])
+
+    def create_next_population(self, size:int=None) -> Population:
         """Perform selection, crossover, and mutation on the population.
 
+        With elitism, the fittest individuals lead the next generation unchanged and keep their fitness,
+        and only the rest are bred. When caching, offspring identical to their selected parent carry
+        the parent's fitness forward.
+
+        Args:
+            size (int, optional): Number of offspring, without elites. Defaults to the whole next generation.
+
         Returns:
-            Population: The proposed next generation of the population.
+            Population: The proposed next generation of the population, or a batch of offspring.
         """
-        return Population(self.gene_wise_mutation(self.single_point_crossover(self.selection_mechanism())))
+        elites = None
+        if size is None and self.elitism > 0:
+            elites = self._top_indices(self.population.fitnesses, self.elitism)
+            size = self.pop_size - len(elites)
+        with self._stage('selection'):
+            mating_pool = self.selection_mechanism(size)
+        with self._stage('crossover'):
+            offspring = self.single_point_crossover(mating_pool.alleles)
+        with self._stage('mutation'):
+            offspring = self.gene_wise_mutation(offspring)
+        if self.instrumentation is not None:
+            self.instrumentation.count('bytes_allocated', mating_pool.alleles.nbytes + mating_pool.fitnesses.nbytes + offspring.nbytes)
+        if self.cache is None:
+            fitnesses, known = None, None
+        else:
+            fitnesses, known = mating_pool.fitnesses, np.all(offspring == mating_pool.alleles, axis=1)
+        if elites is None:
+            return Population(offspring, fitnesses, known=known)
+        return Population(
+            np.concatenate([self.population.alleles[elites], offspring]),
+            np.concatenate([self.population.fitnesses[elites], mating_pool.fitnesses]),
+            known=np.concatenate([np.ones(len(elites), dtype=bool), np.zeros(len(offspring), dtype=bool) if known is None else known])
+        )
 
-    def selection_mechanism(self) -> tuple[Chromosome]:
+    def selection_mechanism(self, size:int=None) -> Population:
         """Perform selection on the population.
 
+        Args:
+            size (int, optional): Number of individuals to select. Defaults to pop_size.
+
         Returns:
-            tuple of Chromosome: A new population after a round of selection.
+            Population: The evaluated mating pool after a round of selection.
         """
         assert self.population.is_evaluated
+        # with a size, e.g. between steady-state steps, the statistics may be stale; let the mechanism sum the fitnesses itself
+        sum_of_fitnesses = self.population.statistics.sum if size is None else None
         try:
-            mechanism : SelectionMechanism = self.Select_Mechanism(tuple(c.fitness_score for c in self.population.members), self.population.sum_of_fitnesses, self.maximize, **self.selection_parameters)
+            mechanism : SelectionMechanism = self.Select_Mechanism(self.population.fitnesses, sum_of_fitnesses, self.maximize, rng=self.rng, **self.selection_parameters)
         except NotImplementedError:
             print('Provided Select_Mechanism not supported.')
             sys.exit(1)
-        return tuple(self.population.members[i] for i in mechanism.next_population())
+        chosen = np.asarray(mechanism.next_population(size), dtype=np.intp)
+        return Population(self.population.alleles[chosen], self.population.fitnesses[chosen])
 
-    def single_point_crossover(self, population:tuple[Chromosome]) -> tuple[Chromosome]:
+    def single_point_crossover(self, population:np.ndarray[np.float64]) -> np.ndarray[np.float64]:
         """Perform single cut-point crossover on the population using self.p_c as probability of occurrence.
 
+        Consecutive rows are paired as parents. Every crossover decision and cut-point is drawn at once,
+        and all offspring are built with a single masked swap. With an odd population size,
+        the last individual has no partner and passes through unchanged.
+
         Args:
-            population (tuple of Chromosome): The population to act upon.
+            population (np.ndarray of float): The (pop_size, dims) allele matrix to act upon.
 
         Returns:
-            tuple of Chromosome: A new population after a round of single cut-point crossover.
-        """
-        next_gen = []
-        for i in np.arange(0, self.pop_size, step=2):
-            p1 = population[i]
-            p2 = population[i+1]
-            if np.random.uniform(0, 1) > self.p_c:
-                # no crossover, send parents to next gen
-                next_gen.append(p1)
-                next_gen.append(p2)
-                continue
-            cut_point = np.random.randint(1, self.dims)
-            next_gen.append(Chromosome(np.concatenate((p1.alleles[0:cut_point], p2.alleles[cut_point:self.dims]))))
-            next_gen.append(Chromosome(np.concatenate((p2.alleles[0:cut_point], p1.alleles[cut_point:self.dims]))))
-        return tuple(next_gen)
+            np.ndarray of float: A new allele matrix after a round of single cut-point crossover.
+        """
+        n_pairs = len(population) // 2
+        if n_pairs == 0 or self.dims < 2:
+            return population.copy()
+        crossed = self.rng.uniform(0, 1, size=n_pairs) <= self.p_c
+        cut_points = self.rng.integers(1, self.dims, size=n_pairs)
+        return operators.single_point_crossover(population, crossed, cut_points)
 
-    def gene_wise_mutation(self, population:tuple[Chromosome]) -> tuple[Chromosome]:
+    def gene_wise_mutation(self, population:np.ndarray[np.float64]) -> np.ndarray[np.float64]:
         """Perform gene-wise mutation on the population using self.p_m as probability of occurrence.
 
+        The allele matrix is mutated in place. In 'dense' mode one Bernoulli(p_m) mask and one Gaussian
+        noise matrix are drawn for the whole population. In 'sparse' mode only the mutated positions are
+        drawn, by skipping ahead geometrically distributed gaps, so the work is proportional to p_m.
+
         Args:
-            population (tuple of Chromosome): The population to act upon.
+            population (np.ndarray of float): The (pop_size, dims) allele matrix to act upon.
 
         Returns:
-            tuple of Chromosome: A new population after a round of gene-wise mutation.
-        """
-        next_gen = []
-        for c in population:
-            next_alleles = np.ndarray(shape=(self.dims), dtype=np.float64)
-            for i, a in enumerate(c.alleles):
-                if np.random.uniform(0, 1) > self.p_m:
-                    # no mutation
-                    next_alleles[i] = a
-                    continue
-                next_alleles[i] = a + np.random.normal(0, self.mutation_standard_deviation)
-            next_gen.append(Chromosome(next_alleles))
-        return tuple(next_gen)
+            np.ndarray of float: The allele matrix after a round of gene-wise mutation.
+        """
+        if self.mutation_mode == 'sparse':
+            flat = population.reshape(-1)
+            positions = operators.sparse_mutation_positions(self.p_m, flat.size, self.rng)
+            flat[positions] += self._mutation_noise(len(positions))
+            return population
+        mask = self.rng.uniform(0, 1, size=population.shape) <= self.p_m
+        noise = self._mutation_noise(population.shape)
+        np.add(population, noise, out=population, where=mask)
+        return population
+
+    def _mutation_noise(self, size:int|tuple[int]) -> np.ndarray:
+        """Gaussian mutation noise in the allele dtype.
+
+        The noise is drawn in float64 and then cast, so a float32 run consumes the same random stream
+        as a float64 run with the same seed, and the two can be compared.
+        """
+        return self.rng.normal(0, self.mutation_standard_deviation, size=size).astype(self.dtype, copy=False)
 
     def evaluate_population(self) -> None:
         """Evaluate an entire iteration/generation's population.
         
-        Track fitness scores using a tuple containing (index, fitness_score).
+        Fitness scores are written into the population's fitness vector.
         """
-        self.population.evaluate(self.fitness_function)
+        hits = 0 if self.cache is None else self.cache.hits
+        with self._stage('evaluation'):
+            self.population.evaluate(self.fitness_function, self.evaluator, self.cache, self.deduplicate)
+        if self.instrumentation is not None:
+            self.instrumentation.count('evaluations', self.population.evaluations)
+            self.instrumentation.count('duplicates', self.population.duplicates)
+            self.instrumentation.count('cache_hits', 0 if self.cache is None else self.cache.hits - hits)
+        self._record_generation()
+
+    def _record_generation(self) -> None:
+        """Record the evaluated generation in the history, and track progress towards the termination criteria."""
+        if self.instrumentation is not None:
+            self.instrumentation.count('generations', 1)
+        if self._history is not None:
+            self._history.record(self.t, self.population)
+        self._track_progress()
+
+    def _stage(self, name:str):
+        """Timer for one stage of a generation, or a shared null context when instrumentation is off."""
+        return NULL_STAGE if self.instrumentation is None else self.instrumentation.stage(name)
+
+    def write_checkpoint(self) -> None:
+        """Snapshot the current generation and hand it to the background writer."""
+        if self._checkpoints is None:
+            self._checkpoints = checkpoint.CheckpointWriter(self.checkpoint_path)
+        self._checkpoints.submit(checkpoint.snapshot(self))
 
     def initialize_population(self) -> None:
         """
@@ -188,39 +548,92 @@ class GA:
         if self.population is not None:
             raise RuntimeError('Population already initialized')
         self.population = Population(
-            tuple(
-                Chromosome(
-                    np.random.uniform(self.domain_lower, self.domain_upper, size=self.dims)
-                )
-                for _ in np.arange(self.pop_size)
-            )
+            self.rng.uniform(self.domain_lower, self.domain_upper, size=(self.pop_size, self.dims)).astype(self.dtype, copy=False)
         )
 
-    def seed_random(self, given_seed:int=None) -> None:
+    def emigrants(self, m:int) -> tuple[np.ndarray]:
+        """Copy out the m fittest individuals of the current population.
+
+        Args:
+            m (int): Number of individuals.
+
+        Returns:
+            tuple of np.ndarray: The (m, dims) alleles and (m,) fitnesses of the fittest individuals.
+        """
+        assert self.population.is_evaluated and m > 0
+        chosen = self._top_indices(self.population.fitnesses, min(m, self.pop_size))
+        return self.population.alleles[chosen], self.population.fitnesses[chosen]
+
+    def immigrate(self, alleles:np.ndarray[np.float64], fitnesses:np.ndarray[np.float64]) -> None:
+        """Replace the least fit individuals of the current population with already-evaluated immigrants.
+
+        Args:
+            alleles (np.ndarray of float): The (m, dims) immigrant alleles.
+            fitnesses (np.ndarray of float): The (m,) immigrant fitness scores.
         """
-        Initialize the random seed using a made-up via hand-waving function.
-        
+        assert self.population.is_evaluated and len(alleles) == len(fitnesses)
+        m = min(len(alleles), self.pop_size)
+        if m == 0:
+            return
+        worst = self._top_indices(self.population.fitnesses, m, best=False)
+        self.population.replace(worst, alleles[:m], fitnesses[:m])
+
+    def _top_indices(self, fitnesses:np.ndarray[np.float64], m:int, best:bool=True) -> np.ndarray[np.signedinteger]:
+        """Indices of the m best (or worst) fitness scores, in no particular order, found in O(pop_size)."""
+        ordered = -fitnesses if self.maximize == best else fitnesses
+        if m >= len(fitnesses):
+            return np.arange(len(fitnesses))
+        return np.argpartition(ordered, m - 1)[:m]
+
+    def seed_random(self, given_seed:int=None, bit_generator:str='PCG64') -> None:
+        """
+        Initialize this GA's random number generator from a seed.
+
+        Without a given seed, one is drawn from OS entropy and exported so the run can be reproduced.
+        The global np.random state is left untouched, so several GAs may run side by side.
         This can only happen when there is no current random seed.
 
         Args:
             given_seed (int, optional): Seed for random number generator
+            bit_generator (str, optional): 'PCG64' or 'Philox'. Default 'PCG64'.
         """
         if self.rand_seed is not None:
             raise RuntimeError('Random already seeded')
         if given_seed is not None:
             self.rand_seed = int(given_seed)
         else:
-            np.random.seed(int(time.time()))
-            # seed random using datetime, then export the result of that to re-seed
-            self.rand_seed = np.random.randint(1, 123456789)
-        print(f'Seeding random with {self.rand_seed}')
-        np.random.seed(self.rand_seed)
+            self.rand_seed = int(np.random.default_rng().integers(1, 123456789))
+        if self.verbose:
+            print(f'Seeding random with {self.rand_seed}')
+        self.seed_sequence = np.random.SeedSequence(self.rand_seed)
+        self.rng = np.random.Generator(getattr(np.random, bit_generator)(self.seed_sequence))
+
+    def spawn_rngs(self, n:int) -> list[np.random.Generator]:
+        """Derive independent child random streams, e.g. for islands, replicas or workers.
+
+        Args:
+            n (int): Number of streams to spawn.
+
+        Returns:
+            list of np.random.Generator: Generators of the same kind as self.rng, each reproducible from rand_seed.
+        """
+        BitGenerator = type(self.rng.bit_generator)
+        return [np.random.Generator(BitGenerator(s)) for s in self.seed_sequence.spawn(n)]
 
     def print_stats(self) -> None:
         print(f'----------- Gen. {self.t} ---------------')
-        print(f'High  Fitness: {self.population.high_score.fitness_score} by {self.population.high_score.alleles}')
-        print(f'Low   Fitness: {self.population.low_score.fitness_score} by {self.population.low_score.alleles}')
-        print(f'Avg   Fitness: {self.population.average_fitness}')
+        stats = self.population.statistics
+        print(f'High  Fitness: {stats.max} by {self.population.alleles[stats.argmax]}')
+        print(f'Low   Fitness: {stats.min} by {self.population.alleles[stats.argmin]}')
+        print(f'Avg   Fitness: {stats.mean}')
+        report = self.evaluator.report()
+        if len(report) > 0:
+            print(report)
+        if self.cache is not None:
+            print(self.cache.report())
+        if self.deduplicate:
+            duplicates, scored = self.population.duplicates, self.population.duplicates + self.population.evaluations
+            print(f'Dedup Ratio: {duplicates / scored if scored > 0 else 0.0:.1%} ({duplicates} of {scored} rows were duplicates)')
 
     @property
     def population(self) -> Population:
@@ -228,7 +641,7 @@ class GA:
 
     @population.setter
     def population(self, value:Population) -> None:
-        assert (value is None and self.pop_size is not None) or len(value.members) == self.pop_size
+        assert (value is None and self.pop_size is not None) or len(value) == self.pop_size
         self._population = value
 
 
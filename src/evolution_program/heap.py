@@ -0,0 +1,85 @@
+# ahester57
+
+import numpy as np
+
+
+class IndexedHeap:
+    """A binary min-heap over the individuals of a population, keyed on fitness and addressable by individual.
+
+    Finding the least (or, with reverse, the greatest) key is O(1), and changing any individual's key is O(log n),
+    so a steady-state GA can repeatedly replace its worst individual without rescanning the population.
+
+    Attributes:
+        keys (np.ndarray of float): The key of each individual, by individual index.
+        reverse (bool): Whether the top is the greatest key rather than the least.
+    """
+    def __init__(self, keys:np.ndarray[np.float64], reverse:bool=False) -> None:
+        """Build a heap over every individual. A sorted order is a valid heap, so this is one argsort.
+
+        Args:
+            keys (np.ndarray of float): The key of each individual, e.g. the fitness vector. Copied.
+            reverse (bool, optional): Put the greatest key on top. Default False.
+        """
+        self.keys = np.array(keys, dtype=np.float64)
+        self.reverse = reverse
+        self._sign = -1.0 if reverse else 1.0
+        # plain lists are faster than arrays for the element-at-a-time sifting below
+        self._order = [self._sign * k for k in self.keys.tolist()]
+        heap = np.argsort(self._sign * self.keys, kind='stable')
+        position = np.empty_like(heap)
+        position[heap] = np.arange(len(heap))
+        self._heap = heap.tolist()
+        self._position = position.tolist()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def top(self) -> int:
+        """Index of the individual with the least key (greatest, if reverse)."""
+        return self._heap[0]
+
+    def update(self, index:int, key:float) -> None:
+        """Change one individual's key and restore the heap order in O(log n).
+
+        Args:
+            index (int): The individual.
+            key (float): Its new key.
+        """
+        self.keys[index] = key
+        self._order[index] = self._sign * float(key)
+        position = self._position[index]
+        if position > 0 and self._order[index] < self._order[self._heap[(position - 1) // 2]]:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def _sift_up(self, position:int) -> None:
+        heap, order, positions = self._heap, self._order, self._position
+        index = heap[position]
+        while position > 0:
+            parent = (position - 1) // 2
+            if order[heap[parent]] <= order[index]:
+                break
+            heap[position] = heap[parent]
+            positions[heap[position]] = position
+            position = parent
+        heap[position] = index
+        positions[index] = position
+
+    def _sift_down(self, position:int) -> None:
+        heap, order, positions = self._heap, self._order, self._position
+        index = heap[position]
+        n = len(heap)
+        while True:
+            child = 2 * position + 1
+            if child >= n:
+                break
+            if child + 1 < n and order[heap[child + 1]] < order[heap[child]]:
+                child += 1
+            if order[index] <= order[heap[child]]:
+                break
+            heap[position] = heap[child]
+            positions[heap[position]] = position
+            position = child
+        heap[position] = index
+        positions[index] = position
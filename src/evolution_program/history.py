@@ -0,0 +1,156 @@
+# ahester57
+
+import json
+import numpy as np
+import os
+
+from evolution_program.population import Population
+
+
+# Per-generation columns, each stored as its own (t_max + 1,) .npy file
+COLUMNS = {
+    'min': np.float64,
+    'max': np.float64,
+    'mean': np.float64,
+    'variance': np.float64,
+    'q25': np.float64,
+    'median': np.float64,
+    'q75': np.float64,
+    'evaluations': np.int64
+}
+
+
+class HistoryRecorder:
+    """Records per-generation statistics, and optionally every population, into preallocated memory-mapped arrays.
+
+    Each column is a .npy file in `path`, sized for generations 0 through t_max, so recording a generation
+    is a handful of stores into mapped memory; nothing is formatted or written until flush.
+    history.json describes the files from the start, so a history left by a crash can still be read back
+    with load_history.
+
+    Attributes:
+        path (str): Directory holding the column files.
+        t_max (int): Last generation that can be recorded.
+        snapshots (bool): Whether every generation's alleles and fitnesses are kept too.
+        recorded (int): One past the last generation recorded.
+    """
+    def __init__(self, path:str, t_max:int, pop_size:int, dims:int, snapshots:bool=False, recorded:int=0, dtype:type=np.float64) -> None:
+        """Create (or reopen) the memory-mapped history arrays.
+
+        Args:
+            path (str): Directory for the column files. Created if missing.
+            t_max (int): Last generation that can be recorded.
+            pop_size (int): Population size, for snapshots.
+            dims (int): Dimensions of chromosome vector, for snapshots.
+            snapshots (bool, optional): Also keep every generation's alleles and fitnesses. Default False.
+            recorded (int, optional): Number of generations already in `path` to keep, e.g. the checkpoint's t + 1 when
+                resuming from it. Later rows are cleared. Default 0 (start afresh).
+            dtype (type, optional): Allele dtype, for snapshots. Default np.float64.
+        """
+        assert path is not None and len(path) > 0
+        assert t_max > 0
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.t_max = int(t_max)
+        self.snapshots = snapshots
+        self.recorded = min(int(recorded), self.t_max + 1)
+        self._meta = {'t_max': self.t_max, 'pop_size': int(pop_size), 'dims': int(dims), 'snapshots': snapshots, 'dtype': np.dtype(dtype).name}
+        rows = self.t_max + 1
+        self._columns = {name: self._open(name, (rows,), dtype) for name, dtype in COLUMNS.items()}
+        if self.snapshots:
+            self._alleles = self._open('alleles', (rows, pop_size, dims), dtype)
+            self._fitnesses = self._open('fitnesses', (rows, pop_size), np.float64)
+        self._write_meta()
+
+    def _open(self, name:str, shape:tuple[int], dtype:type) -> np.memmap:
+        """Map a .npy file, keeping the first `recorded` rows of an existing one and clearing the rest.
+
+        A file of the right shape is reopened in place; one of another length (e.g. a larger t_max) has its
+        kept rows copied into a fresh file that then replaces it.
+        """
+        filename = os.path.join(self.path, f'{name}.npy')
+        empty = np.nan if np.issubdtype(dtype, np.floating) else -1
+        previous = None
+        if self.recorded > 0 and os.path.exists(filename):
+            previous = np.lib.format.open_memmap(filename, mode='r+')
+            if previous.shape == shape and previous.dtype == dtype:
+                previous[self.recorded:] = empty
+                return previous
+        resized = os.path.join(self.path, f'{name}.resized.npy')
+        array = np.lib.format.open_memmap(resized, mode='w+', dtype=dtype, shape=shape)
+        array[:] = empty
+        if previous is not None and previous.shape[1:] == shape[1:] and previous.dtype == dtype:
+            kept = min(len(previous), self.recorded)
+            array[:kept] = previous[:kept]
+        del previous
+        os.replace(resized, filename)
+        return array
+
+    def record(self, t:int, population:Population) -> None:
+        """Store generation t's statistics, and its population if snapshotting.
+
+        Args:
+            t (int): The generation, in [0, t_max].
+            population (Population): The evaluated population of generation t.
+        """
+        stats = population.statistics
+        columns = self._columns
+        columns['min'][t] = stats.min
+        columns['max'][t] = stats.max
+        columns['mean'][t] = stats.mean
+        columns['variance'][t] = stats.variance
+        columns['q25'][t], columns['median'][t], columns['q75'][t] = stats.quantiles
+        columns['evaluations'][t] = population.evaluations
+        if self.snapshots:
+            self._alleles[t] = population.alleles
+            self._fitnesses[t] = population.fitnesses
+        self.recorded = max(self.recorded, t + 1)
+
+    def flush(self) -> None:
+        """Write every recorded generation out to disk in one pass."""
+        for column in self._columns.values():
+            column.flush()
+        if self.snapshots:
+            self._alleles.flush()
+            self._fitnesses.flush()
+        self._write_meta()
+
+    def _write_meta(self) -> None:
+        with open(os.path.join(self.path, 'history.json'), 'w') as f:
+            json.dump({**self._meta, 'recorded': self.recorded}, f)
+
+    def close(self) -> None:
+        """Flush and unmap the history arrays."""
+        self.flush()
+        self._columns = {}
+        if self.snapshots:
+            self._alleles = self._fitnesses = None
+
+
+def _read_meta(path:str) -> dict:
+    filename = os.path.join(path, 'history.json')
+    if not os.path.exists(filename):
+        return {}
+    with open(filename) as f:
+        return json.load(f)
+
+
+def load_history(path:str) -> dict[str, np.ndarray]:
+    """Open a recorded history for analysis.
+
+    Args:
+        path (str): Directory written by a HistoryRecorder.
+
+    Returns:
+        dict of np.ndarray: Each column, and with snapshots 'alleles' and 'fitnesses', as read-only
+        memory maps trimmed to the generations recorded. Row t is generation t.
+    """
+    meta = _read_meta(path)
+    snapshots = meta.get('snapshots', os.path.exists(os.path.join(path, 'alleles.npy')))
+    names = list(COLUMNS) + (['alleles', 'fitnesses'] if snapshots else [])
+    columns = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r') for name in names}
+    # history.json is only brought up to date on flush, so after a crash count the rows actually recorded,
+    # which are the ones with an evaluation count (unrecorded rows hold -1)
+    recorded = np.flatnonzero(columns['evaluations'] >= 0)
+    recorded = int(recorded[-1]) + 1 if len(recorded) > 0 else 0
+    return {name: column[:recorded] for name, column in columns.items()}
@@ -0,0 +1,214 @@
+# ahester57
+
+import numpy as np
+import os
+import time
+
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+
+from evolution_program.ga import GA
+
+
+def _reached(ga:GA, target_fitness:float) -> bool:
+    """Whether the GA's current best fitness meets the target."""
+    if target_fitness is None:
+        return False
+    stats = ga.population.statistics
+    return stats.max >= target_fitness if ga.maximize else stats.min <= target_fitness
+
+
+def _run_island(conn:Connection, ga_parameters:dict, rand_seed:int, migration_interval:int, migrants:int, target_fitness:float) -> None:
+    """Run one island in a worker process, exchanging migrants with the coordinator every migration_interval generations.
+
+    Args:
+        conn (Connection): Pipe to the coordinator.
+        ga_parameters (dict): Keyword arguments for this island's GA.
+        rand_seed (int): Seed for this island's GA.
+        migration_interval (int): Generations between migrations.
+        migrants (int): Number of individuals sent at each migration.
+        target_fitness (float): Fitness at which time-to-target is recorded. None disables it.
+    """
+    ga = GA(rand_seed=rand_seed, verbose=False, **ga_parameters)
+    start = time.perf_counter()
+    target = None
+    try:
+        ga.initialize_population()
+        ga.evaluate_population()
+        evaluations = ga.population.evaluations
+        while ga.t < ga.t_max:
+            for _ in np.arange(min(migration_interval, ga.t_max - ga.t)):
+                ga.iterate()
+                evaluations += ga.population.evaluations
+                if target is None and _reached(ga, target_fitness):
+                    target = (ga.t, time.perf_counter() - start)
+            if ga.t < ga.t_max:
+                conn.send(ga.emigrants(migrants))
+                ga.immigrate(*conn.recv())
+        stats = ga.population.statistics
+        best = stats.argmax if ga.maximize else stats.argmin
+        conn.send({
+            'rand_seed': ga.rand_seed,
+            'Select_Mechanism': ga.Select_Mechanism.__name__,
+            'best_fitness': float(ga.population.fitnesses[best]),
+            'best_alleles': ga.population.alleles[best].tolist(),
+            'generations': ga.t,
+            'evaluations': evaluations,
+            'seconds': time.perf_counter() - start,
+            'target_generation': None if target is None else target[0],
+            'target_seconds': None if target is None else target[1]
+        })
+    finally:
+        ga.evaluator.close()
+        conn.close()
+
+
+class IslandModel:
+    """
+    An island-model GA: several GAs, each in its own process, periodically exchanging their fittest individuals.
+
+    Every migration_interval generations each island sends its top `migrants` individuals to the coordinator,
+    which routes them over the topology; each island replaces its least fit individuals with the best arrivals.
+
+    Attributes:
+        island_parameters (list of dict): GA keyword arguments for each island.
+        topology (str): 'ring' (i receives from i-1), 'full' (from every other island) or 'random' (from one random other island).
+        migration_interval (int): Generations between migrations.
+        migrants (int): Number of individuals sent by each island at each migration.
+        target_fitness (float): Fitness at which each island's time-to-target is recorded.
+        rand_seed (int): Root seed from which island seeds and the random topology are derived.
+        results (list of dict): Per-island summary after simulate.
+    """
+    def __init__(
+        self,
+        island_parameters:list[dict],
+        topology:str='ring',
+        migration_interval:int=10,
+        migrants:int=2,
+        target_fitness:float=None,
+        rand_seed:int=None
+    ) -> None:
+        """
+        Initialize an island model.
+
+        Args:
+            island_parameters (list of dict): GA keyword arguments for each island. All islands must share t_max and maximize.
+            topology (str, optional): 'ring', 'full' or 'random'. Default 'ring'.
+            migration_interval (int, optional): Generations between migrations. Default 10.
+            migrants (int, optional): Number of individuals sent by each island at each migration. Default 2.
+            target_fitness (float, optional): Fitness at which time-to-target is recorded. Defaults to none.
+            rand_seed (int, optional): Root seed for island seeds and the random topology.
+        """
+        assert len(island_parameters) > 0
+        assert topology in ('ring', 'full', 'random')
+        assert migration_interval > 0
+        assert migrants > 0
+        assert len(set(p.get('t_max', 50) for p in island_parameters)) == 1
+        assert len(set(p.get('maximize', True) for p in island_parameters)) == 1
+        self.island_parameters = island_parameters
+        self.topology = topology
+        self.migration_interval = int(migration_interval)
+        self.migrants = int(migrants)
+        self.target_fitness = target_fitness
+        self.maximize = island_parameters[0].get('maximize', True)
+        seed_sequence = np.random.SeedSequence(rand_seed)
+        self.rand_seed = seed_sequence.entropy
+        self._island_seeds = [int(s.generate_state(1)[0]) for s in seed_sequence.spawn(len(island_parameters))]
+        self._rng = np.random.default_rng(seed_sequence.spawn(1)[0])
+        self.results = None
+
+    def simulate(self) -> list[dict]:
+        """Run every island to t_max, routing migrants between them.
+
+        Returns:
+            list of dict: Per-island summary: best fitness and alleles, evaluations, wall time and time-to-target.
+        """
+        n = len(self.island_parameters)
+        pipes = [Pipe() for _ in np.arange(n)]
+        processes = [
+            Process(target=_run_island, args=(child, params, seed, self.migration_interval, self.migrants, self.target_fitness), daemon=True)
+            for (_, child), params, seed in zip(pipes, self.island_parameters, self._island_seeds)
+        ]
+        conns = [parent for parent, _ in pipes]
+        try:
+            for p in processes:
+                p.start()
+            while True:
+                messages = [conn.recv() for conn in conns]
+                if isinstance(messages[0], dict):
+                    self.results = messages
+                    return self.results
+                for conn, immigrants in zip(conns, self._route(messages)):
+                    conn.send(immigrants)
+        finally:
+            for p in processes:
+                p.join(timeout=5)
+                if p.is_alive():
+                    p.terminate()
+
+    def _route(self, emigrants:list[tuple]) -> list[tuple]:
+        """Decide which emigrants each island receives, according to the topology.
+
+        Args:
+            emigrants (list of tuple): Each island's (alleles, fitnesses) emigrants.
+
+        Returns:
+            list of tuple: Each island's (alleles, fitnesses) immigrants, at most `migrants` of the best arrivals.
+        """
+        n = len(emigrants)
+        if n == 1:
+            # nowhere to migrate from
+            return [(emigrants[0][0][:0], emigrants[0][1][:0])]
+        if self.topology == 'ring':
+            sources = [[(i - 1) % n] for i in np.arange(n)]
+        elif self.topology == 'full':
+            sources = [[j for j in np.arange(n) if j != i] for i in np.arange(n)]
+        else:
+            sources = [[(i + self._rng.integers(1, n)) % n] for i in np.arange(n)]
+        routed = []
+        for src in sources:
+            alleles = np.concatenate([emigrants[j][0] for j in src])
+            fitnesses = np.concatenate([emigrants[j][1] for j in src])
+            best = np.argsort(-fitnesses if self.maximize else fitnesses, kind='stable')[:self.migrants]
+            routed.append((alleles[best], fitnesses[best]))
+        return routed
+
+    @property
+    def best(self) -> dict:
+        """The summary of the island holding the best individual found."""
+        assert self.results is not None
+        key = lambda r: r['best_fitness']
+        return max(self.results, key=key) if self.maximize else min(self.results, key=key)
+
+
+if __name__ == '__main__':
+    # Scaling and time-to-target against one panmictic population of the same total size
+    from evolution_program.selection_mechanism.ranking import LinearRanking
+    from evolution_program.selection_mechanism.tournament import DeterministicTournament, StochasticTournament
+    from evolution_program.selection_mechanism.truncation import Truncation
+    mechanisms = [
+        (DeterministicTournament, {'k': 2}),
+        (StochasticTournament, {'k': 2, 'prob': 0.9}),
+        (LinearRanking, {'max': 1.2}),
+        (Truncation, {'tao': 0.4})
+    ]
+    base = {'dims': 2, 'domain_lower': -65.536, 'domain_upper': 65.536, 'pop_size': 200, 't_max': 200, 'maximize': False}
+    target = 1.0
+    for n in sorted(set([1, 2, 4, os.cpu_count() or 1])):
+        islands = [{**base, 'Select_Mechanism': m, 'selection_parameters': p} for m, p in (mechanisms * n)[:n]]
+        model = IslandModel(islands, topology='ring', migration_interval=10, migrants=2, target_fitness=target, rand_seed=1)
+        start = time.perf_counter()
+        model.simulate()
+        seconds = time.perf_counter() - start
+        hits = [r['target_seconds'] for r in model.results if r['target_seconds'] is not None]
+        print(f'{n:3d} islands x {base["pop_size"]}: {seconds:.3f}s, best {model.best["best_fitness"]:.6g}, time-to-target {min(hits, default=float("nan")):.3f}s')
+        ga = GA(**{**base, 'pop_size': base['pop_size'] * n}, Select_Mechanism=DeterministicTournament, rand_seed=1, verbose=False)
+        start = time.perf_counter()
+        ga.initialize_population()
+        ga.evaluate_population()
+        hit = None
+        for _ in np.arange(ga.t_max):
+            ga.iterate()
+            if hit is None and _reached(ga, target):
+                hit = time.perf_counter() - start
+        print(f'  1 population x {ga.pop_size}: {time.perf_counter() - start:.3f}s, best {ga.population.statistics.min:.6g}, time-to-target {hit if hit is not None else float("nan"):.3f}s')
@@ -100,6 +100,42 @@ Selection Mechanisms
             except ValueError:
                 ans = ''
 
+    def prompt_str(self, name:str, default:str=None) -> str:
+        """Prompt for a string value.
+        
+        Args:
+            name (str): The prompt name.
+            default (str, optional): The default value if no answer provided.
+
+        Returns:
+            str: The user-provided input.
+        """
+        assert default is None or type(default) is str
+        ans = ''
+        while len(ans) == 0:
+            ans = input(self.input_display(name, default)).strip()
+            if ans == '' and default is not None:
+                return default
+        return ans
+
+    def prompt_parameter(self, name:str, default) -> object:
+        """Prompt for a value of the same type as the default.
+
+        Args:
+            name (str): The prompt name.
+            default (float, int, bool or str): The default value if no answer provided.
+
+        Returns:
+            object: The user-provided input.
+        """
+        prompt = {
+            bool: self.prompt_bool,
+            int: self.prompt_int,
+            float: self.prompt_float,
+            str: self.prompt_str
+        }[type(default)]
+        return prompt(name, default)
+
     def prompt_bool(self, name:str, default:bool=None) -> bool:
         """Prompt for a bool value.
         
@@ -128,7 +164,7 @@ Selection Mechanisms
                 Select_Mechanism = self.selection_mechanism_menu()
                 selection_parameters = {}
                 for k, v in Select_Mechanism.parameters().items():
-                    selection_parameters.update({k: self.prompt_float(v[0], v[1])})
+                    selection_parameters.update({k: self.prompt_parameter(v[0], v[1])})
                 return GA(
                     dims=self.prompt_int('Dimensions', 2),
                     domain_lower=self.prompt_float('Domain Lower Bound', -65.536),
@@ -0,0 +1,57 @@
+# ahester57
+
+import numpy as np
+
+
+def single_point_crossover(population:np.ndarray[np.float64], crossed:np.ndarray[np.bool_], cut_points:np.ndarray[np.signedinteger]) -> np.ndarray[np.float64]:
+    """Build offspring by single cut-point crossover of consecutive rows, given pre-drawn decisions.
+
+    Rows 2i and 2i+1 are the parents of pair i. Any leading dimensions are treated as independent batches.
+    With an odd number of rows, the last row has no partner and passes through unchanged.
+
+    Args:
+        population (np.ndarray of float): The (..., n, dims) allele matrix to act upon.
+        crossed (np.ndarray of bool): The (..., n // 2) mask of pairs that cross over.
+        cut_points (np.ndarray of int): The (..., n // 2) cut-points, each in [1, dims).
+
+    Returns:
+        np.ndarray of float: A new allele matrix after a round of single cut-point crossover.
+    """
+    n_pairs = population.shape[-2] // 2
+    next_gen = population.copy()
+    if n_pairs == 0:
+        return next_gen
+    p1 = population[..., 0:2*n_pairs:2, :]
+    p2 = population[..., 1:2*n_pairs:2, :]
+    # swap[..., i, j] is True where pair i exchanges gene j, i.e. to the right of its cut-point
+    swap = (np.arange(population.shape[-1]) >= cut_points[..., np.newaxis]) & crossed[..., np.newaxis]
+    next_gen[..., 0:2*n_pairs:2, :] = np.where(swap, p2, p1)
+    next_gen[..., 1:2*n_pairs:2, :] = np.where(swap, p1, p2)
+    return next_gen
+
+
+def sparse_mutation_positions(p_m:float, size:int, random=np.random) -> np.ndarray[np.signedinteger]:
+    """Draw the flat positions of mutated genes as a Bernoulli(p_m) process over `size` genes.
+
+    Gaps between successive mutations are geometrically distributed, so only about p_m * size draws are made.
+
+    Args:
+        p_m (float): Probability of mutation of each gene.
+        size (int): Number of genes.
+        random (np.random.Generator, optional): Source of randomness. Defaults to the global np.random state.
+
+    Returns:
+        np.ndarray of int: Sorted flat indices of the genes to mutate.
+    """
+    if p_m == 0 or size == 0:
+        return np.empty(0, dtype=np.intp)
+    chunks = []
+    last = -1
+    while last < size - 1:
+        expected = (size - 1 - last) * p_m
+        gaps = random.geometric(p_m, size=int(expected + 4 * np.sqrt(expected) + 16))
+        positions = last + np.cumsum(gaps)
+        chunks.append(positions)
+        last = positions[-1]
+    positions = np.concatenate(chunks)
+    return positions[positions < size]
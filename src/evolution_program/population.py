@@ -2,85 +2,216 @@
 
 import numpy as np
 
-from collections import deque
 from typing import Callable
 
+import evolution_program.fitness as fitness
+from evolution_program.cache import FitnessCache
 from evolution_program.chromosome import Chromosome
+from evolution_program.evaluation.asynchronous import AsyncEvaluator
+from evolution_program.evaluation.evaluator import Evaluator
 
 
 class Population:
     """Depicts a population of chromosomes.
 
+    The population is stored as one contiguous (pop_size, dims) allele matrix
+    and one (pop_size,) fitness vector.
+
     Attributes:
-        members (tuple of Chromosome): Individual chromosome's values.
+        alleles (np.ndarray of float): Allele matrix, one row per individual. float64, or float32 if given float32.
+        fitnesses (np.ndarray of float): Fitness vector, one score per individual.
+        evaluations (int): Number of fitness function calls made by the last evaluation.
+        duplicates (int): Number of rows the last evaluation scored by copying an identical row's score.
         _is_evaluated (bool): Whether this population has been evaluated yet.
+        _known (np.ndarray of bool): Rows whose fitness is already known and need no evaluation.
     """
-    def __init__(self, members:tuple[Chromosome]) -> None:
+    def __init__(self, alleles:np.ndarray[np.float64], fitnesses:np.ndarray[np.float64]=None, known:np.ndarray[np.bool_]=None) -> None:
         """Initialize a population.
 
+        Args:
+            alleles (np.ndarray of float): The (pop_size, dims) allele matrix to be represented.
+            fitnesses (np.ndarray of float, optional): The (pop_size,) fitness scores, if already known.
+            known (np.ndarray of bool, optional): Rows of `fitnesses` that are valid. Defaults to all of them.
+        """
+        assert alleles is not None and type(alleles) is np.ndarray and alleles.ndim == 2
+        assert known is None or fitnesses is not None
+        self.alleles = np.ascontiguousarray(fitness.as_float_array(alleles))
+        self._is_evaluated = fitnesses is not None and (known is None or bool(np.all(known)))
+        # kept even when every row is known, so that evaluate has nothing left to score
+        self._known = None if known is None else np.asarray(known, dtype=bool)
+        self.evaluations = 0
+        self.duplicates = 0
+        if fitnesses is None:
+            self.fitnesses = np.full(len(self.alleles), np.nan, dtype=np.float64)
+        else:
+            assert fitnesses.shape == (len(self.alleles),)
+            self.fitnesses = np.array(fitnesses, dtype=np.float64)
+        self._members = None
+        self._statistics = None
+
+    @classmethod
+    def from_members(cls, members:tuple[Chromosome]) -> 'Population':
+        """Build a population from individual chromosomes.
+
         Args:
             members (tuple of Chromosome): The population to be represented.
+
+        Returns:
+            Population: A population holding a copy of the members' alleles.
         """
-        assert members is not None and type(members) is tuple
-        self.members = members
-        self._is_evaluated = False
-        self._high_of = None
-        self._low_of = None
-        self._average_fitness = None
-        self._sum_of_fitnesses = None
-
-    def evaluate(self, fitness_function:Callable) -> None:
+        assert members is not None and type(members) is tuple and len(members) > 0
+        alleles = np.stack([c.alleles for c in members])
+        if all(c.is_evaluated for c in members):
+            return cls(alleles, np.array([c.fitness_score for c in members], dtype=np.float64))
+        return cls(alleles)
+
+    def __len__(self) -> int:
+        return len(self.alleles)
+
+    def evaluate(self, fitness_function:Callable, evaluator:Evaluator=None, cache:FitnessCache=None, deduplicate:bool=False, maximize:bool=True) -> None:
         """Evaluate the population with the given fitness function.
 
+        Batch fitness functions (see fitness.batch) score the whole allele matrix in one call.
+        Other callables are called once per row. `async def` fitness functions are run on an
+        AsyncEvaluator with its default concurrency unless an evaluator is given.
+        Rows whose fitness is already known are skipped, and rows found in the cache are not re-scored.
+        When deduplicating, each distinct row is scored once and its score copied to its duplicates.
+
         Args:
             fitness_function (Callable): The "fitness function" or "objective function."
+            evaluator (Evaluator, optional): Backend to evaluate with. Defaults to in-process.
+            cache (FitnessCache, optional): Memo of previously computed scores.
+            deduplicate (bool, optional): Score bit-identical rows once. Default False.
+            maximize (bool, optional): Direction of the default AsyncEvaluator's penalty for failed calls. Default True.
         """
         assert fitness_function is not None and callable(fitness_function)
-        deque((c.evaluate(fitness_function) for c in self.members), maxlen=0) # execute the generator
+        if evaluator is None and fitness.is_async(fitness_function):
+            evaluator = AsyncEvaluator(maximize)
+        pending = np.arange(len(self)) if self._known is None else np.flatnonzero(~self._known)
+        if cache is not None and len(pending) > 0:
+            scores, found = cache.lookup(self.alleles[pending])
+            self.fitnesses[pending[found]] = scores[found]
+            pending = pending[~found]
+        evaluated = len(pending)
+        if len(pending) > 0:
+            # avoid copying the allele matrix when every row is pending
+            alleles = self.alleles if len(pending) == len(self) else self.alleles[pending]
+            inverse = None
+            if deduplicate:
+                alleles, inverse = _unique_rows(alleles)
+                evaluated = len(alleles)
+            if evaluator is None:
+                scores = fitness.evaluate(fitness_function, alleles)
+            else:
+                scores = evaluator.evaluate(alleles, fitness_function)
+            self.fitnesses[pending] = scores if inverse is None else scores[inverse]
+            if cache is not None:
+                cache.store(alleles, scores)
+        self.evaluations = evaluated
+        self.duplicates = len(pending) - evaluated
+        self._known = None
         self._is_evaluated = True
+        self._statistics = PopulationStatistics(self.fitnesses)
+
+    def replace(self, indices:np.ndarray[np.signedinteger], alleles:np.ndarray[np.float64], fitnesses:np.ndarray[np.float64]) -> None:
+        """Overwrite some individuals in place with already-evaluated ones.
+
+        Args:
+            indices (np.ndarray of int): Rows to overwrite.
+            alleles (np.ndarray of float): The (len(indices), dims) replacement alleles.
+            fitnesses (np.ndarray of float): The (len(indices),) replacement fitness scores.
+        """
+        assert self._is_evaluated
+        self.alleles[indices] = alleles
+        self.fitnesses[indices] = fitnesses
+        self._members = None
+        self._statistics = None
+
+    @property
+    def members(self) -> tuple[Chromosome]:
+        """Chromosome views onto each row, built on first access."""
+        if self._members is None:
+            self._members = tuple(Chromosome(row, self.fitnesses, i) for i, row in enumerate(self.alleles))
+        return self._members
+
+    @property
+    def statistics(self) -> 'PopulationStatistics':
+        """Summary statistics of the fitness vector, computed once per evaluation."""
+        if self._statistics is None:
+            assert self._is_evaluated
+            self._statistics = PopulationStatistics(self.fitnesses)
+        return self._statistics
 
     @property
     def high_score(self) -> Chromosome:
-        if self._high_of is not None:
-            return self._high_of
-        assert self._is_evaluated
-        high_fitness = 0
-        for c in self.members:
-            if c.fitness_score > high_fitness:
-                high_fitness = c.fitness_score
-                self._high_of = c
-        return self._high_of
+        i = self.statistics.argmax
+        return Chromosome(self.alleles[i], self.fitnesses, i)
 
     @property
     def low_score(self) -> Chromosome:
-        if self._low_of is not None:
-            return self._low_of
-        assert self._is_evaluated
-        low_fitness = float('inf')
-        for c in self.members:
-            if c.fitness_score < low_fitness:
-                low_fitness = c.fitness_score
-                self._low_of = c
-        return self._low_of
+        i = self.statistics.argmin
+        return Chromosome(self.alleles[i], self.fitnesses, i)
 
     @property
     def average_fitness(self) -> float:
         """\sum_{j=1}^N{f_j} / N"""
-        if self._average_fitness is not None:
-            return self._average_fitness
-        assert self._is_evaluated and len(self.members) > 0
-        self._average_fitness = self.sum_of_fitnesses / len(self.members)
-        return self._average_fitness
+        return self.statistics.mean
 
     @property
     def sum_of_fitnesses(self) -> float:
         """\sum_{j=1}^N{f_j}"""
-        if self._sum_of_fitnesses is not None:
-            return self._sum_of_fitnesses
-        assert self._is_evaluated
-        self._sum_of_fitnesses = np.sum((c.fitness_score for c in self.members))
-        return self._sum_of_fitnesses
+        return self.statistics.sum
 
     @property
     def is_evaluated(self) -> bool:
         return self._is_evaluated
+
+
+def _unique_rows(alleles:np.ndarray[np.float64]) -> tuple[np.ndarray]:
+    """Find the distinct rows of an allele matrix, comparing each row's bytes as one opaque value.
+
+    Args:
+        alleles (np.ndarray of float): The (n, dims) allele matrix.
+
+    Returns:
+        tuple of np.ndarray: The (m, dims) distinct rows, and the (n,) index of each original row among them.
+    """
+    alleles = np.ascontiguousarray(alleles)
+    rows = alleles.view(np.dtype((np.void, alleles.dtype.itemsize * alleles.shape[1]))).ravel()
+    _, first, inverse = np.unique(rows, return_index=True, return_inverse=True)
+    return alleles[first], inverse.ravel()
+
+
+class PopulationStatistics:
+    """Summary statistics of a population's fitness vector, computed together in one place.
+
+    Attributes:
+        min (float): Lowest fitness score.
+        max (float): Highest fitness score.
+        argmin (int): Index of the lowest fitness score.
+        argmax (int): Index of the highest fitness score.
+        sum (float): \sum_{j=1}^N{f_j}
+        mean (float): \sum_{j=1}^N{f_j} / N
+        variance (float): Population variance of the fitness scores.
+        quantiles (np.ndarray of float): Fitness scores at QUANTILES.
+    """
+    QUANTILES = (0.25, 0.5, 0.75)
+
+    __slots__ = ('min', 'max', 'argmin', 'argmax', 'sum', 'mean', 'variance', 'quantiles')
+
+    def __init__(self, fitnesses:np.ndarray[np.float64]) -> None:
+        """Compute summary statistics of a fitness vector.
+
+        Args:
+            fitnesses (np.ndarray of float): The (pop_size,) fitness scores.
+        """
+        assert len(fitnesses) > 0
+        self.argmin = int(np.argmin(fitnesses))
+        self.argmax = int(np.argmax(fitnesses))
+        self.min = fitnesses[self.argmin]
+        self.max = fitnesses[self.argmax]
+        self.sum = np.sum(fitnesses)
+        self.mean = self.sum / len(fitnesses)
+        deviations = fitnesses - self.mean
+        self.variance = np.dot(deviations, deviations) / len(fitnesses)
+        self.quantiles = np.quantile(fitnesses, self.QUANTILES)
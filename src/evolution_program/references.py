@@ -0,0 +1,36 @@
+# ahester57
+
+import importlib
+
+
+def reference(obj:object) -> str:
+    """Name an importable function or class as 'module:qualname', so it can be shared without pickling.
+
+    Args:
+        obj (object): A module-level function or class.
+
+    Returns:
+        str: The reference, e.g. 'evolution_program.test_functions.de_jong_5:fn'.
+    """
+    module, qualname = getattr(obj, '__module__', None), getattr(obj, '__qualname__', None)
+    if module is None or qualname is None or '<' in qualname:
+        raise ValueError(f'{obj!r} is not importable by name')
+    return f'{module}:{qualname}'
+
+
+def resolve(ref:str) -> object:
+    """Import the function or class named by a 'module:qualname' reference.
+
+    Args:
+        ref (str): The reference, e.g. 'evolution_program.test_functions.de_jong_5:fn'.
+
+    Returns:
+        object: The named function or class.
+    """
+    module, _, qualname = ref.partition(':')
+    if len(module) == 0 or len(qualname) == 0:
+        raise ValueError(f'{ref!r} is not a module:qualname reference')
+    obj = importlib.import_module(module)
+    for attr in qualname.split('.'):
+        obj = getattr(obj, attr)
+    return obj
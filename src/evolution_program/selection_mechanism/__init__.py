@@ -0,0 +1,21 @@
+# ahester57
+
+from evolution_program.selection_mechanism.proportional import Proportional
+from evolution_program.selection_mechanism.ranking import LinearRanking
+from evolution_program.selection_mechanism.tournament import DeterministicTournament, StochasticTournament
+from evolution_program.selection_mechanism.truncation import Truncation
+
+
+# Every selection mechanism, by the name used on the command line and in benchmark output
+MECHANISMS = {
+    'proportional': Proportional,
+    'truncation': Truncation,
+    'deterministic_tournament': DeterministicTournament,
+    'stochastic_tournament': StochasticTournament,
+    'linear_ranking': LinearRanking
+}
+
+
+def default_parameters(Select_Mechanism:type) -> dict:
+    """The default value of each of a selection mechanism's parameters()."""
+    return {name: default for name, (_, default) in Select_Mechanism.parameters().items()}
@@ -1,11 +1,25 @@
 # ahester57
 
+import numpy as np
+
 
 class SelectionMechanism:
-    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, **kwargs) -> None:
+    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, rng:np.random.Generator=None, **kwargs) -> None:
+        raise NotImplementedError
+
+    def next_population(self, size:int=None) -> tuple[int]:
         raise NotImplementedError
 
-    def next_population(self) -> tuple[int]:
+    @classmethod
+    def next_populations(cls, population_fitnesses:np.ndarray[np.float64], maximize:bool, rngs:list[np.random.Generator], **kwargs) -> np.ndarray[np.signedinteger]:
+        """Select from many independent populations at once, e.g. the runs of a BatchGA.
+
+        Mechanisms that implement this draw from each population's own rng, as next_population would,
+        and decide every population's selection in one pass over the (populations, pop_size) fitness matrix.
+
+        Raises:
+            NotImplementedError: If the mechanism (or its configuration) can only select one population at a time.
+        """
         raise NotImplementedError
 
     @staticmethod
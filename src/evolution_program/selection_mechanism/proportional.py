@@ -13,8 +13,10 @@ class Proportional(SelectionMechanism):
         sum_of_fitnesses (float): The sum of the populations' fitness scores.
         maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
         pop_size (int): The size of the population.
+        rng (np.random.Generator): Source of randomness.
+        mode (str): Sampling mode. 'choice' (independent draws), 'sus' (stochastic universal sampling) or 'alias' (Walker/Vose alias table).
     """
-    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, **kwargs) -> None:
+    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, rng:np.random.Generator=None, **kwargs) -> None:
         """
         Initialize the parameters for proportional selection with replacement.
 
@@ -22,50 +24,171 @@ class Proportional(SelectionMechanism):
             population_fitnesses (tuple of float): The population fitness scores, in order.
             sum_of_fitnesses (float, optional): The sum of the populations' fitness scores.
             maximize (bool, optional): (False)[minimize]; (True)[maximize]. Default True.
+            rng (np.random.Generator, optional): Source of randomness. Defaults to a fresh, unseeded Generator.
+            mode (str, optional): 'choice', 'sus' or 'alias'. Default 'choice'.
         """
         assert population_fitnesses is not None
-        self.population_fitnesses = population_fitnesses
+        assert kwargs.get('mode', 'choice') in ('choice', 'sus', 'alias')
+        self.population_fitnesses = np.asarray(population_fitnesses, dtype=np.float64)
         self.sum_of_fitnesses = sum_of_fitnesses
         self.maximize = maximize
+        self.rng = rng if rng is not None else np.random.default_rng()
         if self.sum_of_fitnesses is None:
             self.sum_of_fitnesses = np.sum(population_fitnesses)
         self.pop_size = len(self.population_fitnesses)
+        self.mode = kwargs.get('mode', 'choice')
 
-    def next_population(self) -> tuple[int]:
+    def next_population(self, size:int=None) -> tuple[int]:
         """Perform proportional selection with replacement on the population using fitness scores for weights.
 
+        Args:
+            size (int, optional): Number of individuals to select. Defaults to pop_size.
+
         Returns:
             tuple of int: An index-defined population after a round of proportional selection.
         """
-        return self._sample_from_pmf(self._generate_pmf())
+        return self._sample_from_pmf(self._generate_pmf(), self.pop_size if size is None else int(size))
 
-    def _generate_pmf(self) -> tuple[float]:
+    def _generate_pmf(self) -> np.ndarray[np.float64]:
         """Generate a probability mass function for given fitnesses.
 
         Returns:
-            tuple of float: A population-sized list containing respective probablities of selection.
+            np.ndarray of float: A population-sized array containing respective probablities of selection.
         """
         assert self.sum_of_fitnesses > 0
-        pmf = tuple(f / self.sum_of_fitnesses for f in self.population_fitnesses)
-        # TODO: numpy-ify this
+        pmf = self.population_fitnesses / self.sum_of_fitnesses
         if not self.maximize:
             # Minimizing, invert the weights
-            inv_pmf = [1.0 / w for w in pmf]
-            sum_inv_pmf = np.sum(inv_pmf)
-            pmf = tuple(tw / sum_inv_pmf for tw in inv_pmf)
+            inv_pmf = np.reciprocal(pmf)
+            pmf = inv_pmf / np.sum(inv_pmf)
         return pmf
 
-    def _sample_from_pmf(self, pmf:tuple[float]) -> np.ndarray[np.signedinteger]:
+    def _sample_from_pmf(self, pmf:np.ndarray[np.float64], size:int) -> np.ndarray[np.signedinteger]:
         """Generate a new index-defined population by stochastic choice based on the given pmf.
 
         Args:
-            pmf (tuple of float): Probability Mass Function of population's fitness scores.
+            pmf (np.ndarray of float): Probability Mass Function of population's fitness scores.
+            size (int): Number of individuals to choose.
+
+        Returns:
+            np.ndarray of int: A size-length array containing indices of chosen individuals.
+        """
+        if self.mode == 'sus':
+            return self._stochastic_universal_sample(pmf, size)
+        if self.mode == 'alias':
+            return self._sample_from_alias_table(*self._generate_alias_table(pmf), size)
+        return self.rng.choice(self.pop_size, size=size, replace=True, p=pmf)
+
+    def _stochastic_universal_sample(self, pmf:np.ndarray[np.float64], size:int) -> np.ndarray[np.signedinteger]:
+        """Select every individual with a single spin of `size` equally spaced pointers.
+
+        Args:
+            pmf (np.ndarray of float): Probability Mass Function of population's fitness scores.
+            size (int): Number of individuals to choose.
+
+        Returns:
+            np.ndarray of int: A size-length array containing indices of chosen individuals, in random order.
+        """
+        cdf = np.cumsum(pmf)
+        cdf[-1] = 1.0
+        pointers = (self.rng.uniform(0, 1) + np.arange(size)) / size
+        chosen = np.searchsorted(cdf, pointers, side='right')
+        # pointers are sorted, shuffle so that crossover does not pair neighbours of the same parent
+        self.rng.shuffle(chosen)
+        return chosen
+
+    @classmethod
+    def next_populations(cls, population_fitnesses:np.ndarray[np.float64], maximize:bool, rngs:list[np.random.Generator], **kwargs) -> np.ndarray[np.signedinteger]:
+        """Perform stochastic universal sampling on many independent populations at once.
+
+        Only 'sus' mode is batched: every population's pointers are found in one searchsorted over the
+        concatenated cdfs, each offset by its population's row number so that they stay in ascending order.
+
+        Args:
+            population_fitnesses (np.ndarray of float): The (populations, pop_size) fitness matrix.
+            maximize (bool): (False)[minimize]; (True)[maximize].
+            rngs (list of np.random.Generator): Each population's source of randomness.
+            mode (str, optional): Must be 'sus'.
+
+        Returns:
+            np.ndarray of int: A (populations, pop_size) matrix of each population's chosen indices.
+
+        Raises:
+            NotImplementedError: In 'choice' and 'alias' modes.
+        """
+        if kwargs.get('mode', 'choice') != 'sus':
+            raise NotImplementedError
+        runs, pop_size = population_fitnesses.shape
+        sums_of_fitnesses = np.sum(population_fitnesses, axis=1, keepdims=True)
+        assert np.all(sums_of_fitnesses > 0)
+        pmf = population_fitnesses / sums_of_fitnesses
+        if not maximize:
+            inv_pmf = np.reciprocal(pmf)
+            pmf = inv_pmf / np.sum(inv_pmf, axis=1, keepdims=True)
+        cdf = np.cumsum(pmf, axis=1)
+        cdf[:, -1] = 1.0
+        spins = np.array([rng.uniform(0, 1) for rng in rngs])
+        pointers = (spins[:, np.newaxis] + np.arange(pop_size)) / pop_size
+        rows = np.arange(runs)[:, np.newaxis]
+        chosen = np.searchsorted((cdf + rows).ravel(), (pointers + rows).ravel(), side='right').reshape(runs, pop_size) - rows * pop_size
+        # a pointer within rounding of its row's end must not spill into the next row
+        np.minimum(chosen, pop_size - 1, out=chosen)
+        for r, rng in enumerate(rngs):
+            rng.shuffle(chosen[r])
+        return chosen
+
+    def _generate_alias_table(self, pmf:np.ndarray[np.float64]) -> tuple[np.ndarray]:
+        """Build a Walker/Vose alias table for the given pmf, without a Python-level loop.
+
+        Vose's algorithm fills each small slot (scaled weight below 1) from the current large one, moving on to
+        the next large slot once the current one has dropped below 1, which then takes its own shortfall from the next.
+        So a small slot's donor is the first large slot whose cumulative surplus covers the deficits of the small
+        slots before it, and a large slot drops below 1 at the first small slot whose cumulative deficit exceeds
+        its cumulative surplus. Both are found with a searchsorted over cumulative sums.
+
+        Args:
+            pmf (np.ndarray of float): Probability Mass Function of population's fitness scores.
+
+        Returns:
+            tuple of np.ndarray: Per-slot acceptance probabilities, and per-slot alias indices.
+        """
+        scaled = pmf * self.pop_size
+        prob = np.ones(self.pop_size, dtype=np.float64)
+        alias = np.arange(self.pop_size)
+        small = np.flatnonzero(scaled < 1.0)
+        large = np.flatnonzero(scaled >= 1.0)
+        if len(small) == 0 or len(large) == 0:
+            return prob, alias
+        deficit = np.cumsum(1.0 - scaled[small])
+        surplus = np.cumsum(scaled[large] - 1.0)
+        # both searches compare the very same cumulative sums, so ties (common with integer fitnesses) break consistently:
+        # a large slot whose surplus exactly covers the deficits so far is still at 1.0, and still the donor
+        before = np.concatenate(([0.0], deficit[:-1]))
+        donors = np.minimum(np.searchsorted(surplus, before, side='left'), len(large) - 1)
+        prob[small] = scaled[small]
+        alias[small] = large[donors]
+        # large slots, but the last, emptied below 1 and topped up from the next; whatever is left over is 1.0 up to rounding error
+        emptied_at = np.searchsorted(deficit, surplus[:-1], side='right')
+        emptied = np.flatnonzero(emptied_at < len(small))
+        prob[large[emptied]] = 1.0 + surplus[emptied] - deficit[emptied_at[emptied]]
+        alias[large[emptied]] = large[emptied + 1]
+        return prob, alias
+
+    def _sample_from_alias_table(self, prob:np.ndarray[np.float64], alias:np.ndarray[np.signedinteger], size:int) -> np.ndarray[np.signedinteger]:
+        """Draw individuals from an alias table in O(1) per draw.
+
+        Args:
+            prob (np.ndarray of float): Per-slot acceptance probabilities.
+            alias (np.ndarray of int): Per-slot alias indices.
+            size (int): Number of individuals to choose.
 
         Returns:
-            tuple of int: A population-sized list containing indices of chosen individuals.
+            np.ndarray of int: A size-length array containing indices of chosen individuals.
         """
-        return np.random.choice(self.pop_size, size=self.pop_size, replace=True, p=pmf)
+        slots = self.rng.integers(0, self.pop_size, size=size)
+        accept = self.rng.uniform(0, 1, size=size) < prob[slots]
+        return np.where(accept, slots, alias[slots])
 
     @staticmethod
     def parameters() -> dict[str, tuple]:
-        return {}
+        return {'mode': ('Enter Sampling Mode (choice, sus, alias)', 'choice')}
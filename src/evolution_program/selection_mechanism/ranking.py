@@ -2,6 +2,8 @@
 
 import numpy as np
 
+from functools import lru_cache
+
 from evolution_program.selection_mechanism.mechanism import SelectionMechanism
 
 
@@ -13,10 +15,11 @@ class LinearRanking(SelectionMechanism):
         sum_of_fitnesses (float): The sum of the populations' fitness scores.
         maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
         pop_size (int): The size of the population.
+        rng (np.random.Generator): Source of randomness.
         max (float): The expected number of copies of the most fit individual in the next generation.
         min (float): The expected number of copies of the least fit individual in the next generation.
     """
-    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, **kwargs) -> None:
+    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, rng:np.random.Generator=None, **kwargs) -> None:
         """
         Initialize the parameters for linear ranking selection with replacement.
 
@@ -24,67 +27,82 @@ class LinearRanking(SelectionMechanism):
             population_fitnesses (tuple of float): The population fitness scores, in order.
             sum_of_fitnesses (float): The sum of the populations' fitness scores.
             maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
+            rng (np.random.Generator, optional): Source of randomness. Defaults to a fresh, unseeded Generator.
             max (float): The expected number of copies of the most fit individual in the next generation.
         """
         assert population_fitnesses is not None
         assert 'max' in kwargs.keys() and type(kwargs['max']) is float and kwargs['max'] >= 1 and kwargs['max'] <= 2
-        self.population_fitnesses = population_fitnesses
+        self.population_fitnesses = np.asarray(population_fitnesses, dtype=np.float64)
         self.sum_of_fitnesses = sum_of_fitnesses
         self.maximize = maximize
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.max = float(kwargs['max'])
         self.min = 2 - self.max
-        self._max_min = self.max - self.min
         if self.sum_of_fitnesses is None:
             self.sum_of_fitnesses = np.sum(population_fitnesses)
         self.pop_size = len(self.population_fitnesses)
 
-    def next_population(self) -> tuple[int]:
+    def next_population(self, size:int=None) -> np.ndarray[np.signedinteger]:
         """Perform linear ranking selection on the population.
 
+        Args:
+            size (int, optional): Number of individuals to select. Defaults to pop_size.
+
         Returns:
-            tuple of int: An index-defined population after a round of linear ranking selection.
+            np.ndarray of int: An index-defined population after a round of linear ranking selection.
         """
         rank_list = self._generate_linear_ranks()
-        return tuple(rank_list[i] for i in self._sample_from_pmf(self._generate_pmf()))
+        return rank_list[self._sample_from_pmf(self._generate_pmf(), self.pop_size if size is None else int(size))]
 
-    def _generate_linear_ranks(self) -> tuple[int]:
-        """Generate a ranked list of members in order of fitness score.
+    def _generate_linear_ranks(self) -> np.ndarray[np.signedinteger]:
+        """Generate a ranked list of members in order of fitness score, least fit first.
 
         Returns:
-            tuple of int: A population-sized list containing original index in order of rank.
+            np.ndarray of int: A population-sized array containing original index in order of rank.
         """
-        # TODO: numpy-ify this
         assert self.sum_of_fitnesses > 0
-        sorted_keep_indices = [(i, f) for i, f in enumerate(self.population_fitnesses)]
-        sorted_keep_indices.sort(key=lambda x:x[1], reverse=not self.maximize)
-        return tuple(f[0] for f in sorted_keep_indices)
+        ordered = self.population_fitnesses if self.maximize else -self.population_fitnesses
+        return np.argsort(ordered, kind='stable')
 
-    def _generate_pmf(self) -> tuple[float]:
+    def _generate_pmf(self) -> np.ndarray[np.float64]:
         """Generate a probability mass function for the current population.
 
+        The pmf depends only on pop_size and max, so it is computed once per pair and shared.
+
         Returns:
-            list of tuple: A population-sized list containing pmf for this population.
+            np.ndarray of float: A population-sized, read-only array containing the pmf of each rank.
         """
-        # TODO: numpy-ify this
-        return tuple(
-            er / self.pop_size
-            for er in tuple(
-                self.min + (float(rank) / (self.pop_size - 1) * self._max_min)
-                for rank in np.arange(self.pop_size)
-            )
-        )
-
-    def _sample_from_pmf(self, pmf:tuple[float]) -> np.ndarray[np.signedinteger]:
+        return _linear_rank_pmf(self.pop_size, self.max)
+
+    def _sample_from_pmf(self, pmf:np.ndarray[np.float64], size:int) -> np.ndarray[np.signedinteger]:
         """Generate a new index-defined population by stochastic choice based on the given ranks.
 
         Args:
-            pmf (tuple of float): Probability Mass Function of population's fitness scores.
+            pmf (np.ndarray of float): Probability Mass Function of population's fitness scores.
+            size (int): Number of individuals to choose.
 
         Returns:
-            tuple of int: A population-sized list containing indices of chosen individuals.
+            np.ndarray of int: A size-length array containing rank indices of chosen individuals.
         """
-        return np.random.choice(self.pop_size, size=self.pop_size, replace=True, p=pmf)
+        return self.rng.choice(self.pop_size, size=size, replace=True, p=pmf)
 
     @staticmethod
     def parameters() -> dict[str, tuple]:
         return {'max': ('Enter Max (from 1 to 2)', 1.2)}
+
+
+@lru_cache(maxsize=32)
+def _linear_rank_pmf(pop_size:int, max:float) -> np.ndarray[np.float64]:
+    """Probability of selecting each rank, least fit first, under linear ranking.
+
+    Args:
+        pop_size (int): The size of the population.
+        max (float): The expected number of copies of the most fit individual in the next generation.
+
+    Returns:
+        np.ndarray of float: A read-only array of pop_size probabilities.
+    """
+    min = 2 - max
+    pmf = (min + np.arange(pop_size) / (pop_size - 1) * (max - min)) / pop_size
+    pmf.flags.writeable = False
+    return pmf
@@ -2,8 +2,6 @@
 
 import numpy as np
 
-from collections import deque
-
 from evolution_program.selection_mechanism.mechanism import SelectionMechanism
 
 
@@ -11,12 +9,14 @@ class DeterministicTournament(SelectionMechanism):
     """Facilitates deterministic tournament selection.
 
     Attributes:
-        population_fitnesses (tuple of float): The population fitness scores, in order.
+        population_fitnesses (np.ndarray of float): The population fitness scores, in order.
         sum_of_fitnesses (float): The sum of the populations' fitness scores.
         maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
         pop_size (int): The size of the population.
+        rng (np.random.Generator): Source of randomness.
+        k (int): The number of contestants in each tournament.
     """
-    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, **kwargs) -> None:
+    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, rng:np.random.Generator=None, **kwargs) -> None:
         """
         Initialize the parameters for deterministic tournament selection.
 
@@ -24,62 +24,100 @@ class DeterministicTournament(SelectionMechanism):
             population_fitnesses (tuple of float): The population fitness scores, in order.
             sum_of_fitnesses (float): The sum of the populations' fitness scores.
             maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
+            rng (np.random.Generator, optional): Source of randomness. Defaults to a fresh, unseeded Generator.
+            k (int, optional): The number of contestants in each tournament. Default 2.
         """
         assert population_fitnesses is not None
-        self.population_fitnesses = population_fitnesses
+        assert int(kwargs.get('k', 2)) >= 1
+        self.population_fitnesses = np.asarray(population_fitnesses, dtype=np.float64)
         self.sum_of_fitnesses = sum_of_fitnesses
         self.maximize = maximize
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.k = int(kwargs.get('k', 2))
         if self.sum_of_fitnesses is None:
             self.sum_of_fitnesses = np.sum(population_fitnesses)
         self.pop_size = len(self.population_fitnesses)
 
-    def next_population(self) -> tuple[int]:
+    def next_population(self, size:int=None) -> np.ndarray[np.signedinteger]:
         """Perform deterministic tournament selection on the population.
 
+        All tournaments are drawn and decided at once.
+
+        Args:
+            size (int, optional): Number of individuals to select. Defaults to pop_size.
+
+        Returns:
+            np.ndarray of int: An index-defined population after a round of deterministic tournament selection.
+        """
+        return self._compete(self._choose_contestants(self.pop_size if size is None else int(size)))
+
+    def _choose_contestants(self, size:int) -> np.ndarray[np.signedinteger]:
+        """Draw the contestants of every tournament, with replacement.
+
+        Args:
+            size (int): Number of tournaments.
+
         Returns:
-            tuple of int: An index-defined population after a round of deterministic tournament selection.
+            np.ndarray of int: A (size, k) matrix of contestant indices, one row per tournament.
         """
-        next_pop = []
-        deque((next_pop.append(self._compete(*self._choose_two())) for i in np.arange(self.pop_size)), maxlen=0)
-        return tuple(next_pop)
+        return self.rng.integers(0, self.pop_size, size=(size, self.k))
+
+    def _compete(self, contestants:np.ndarray[np.signedinteger]) -> np.ndarray[np.signedinteger]:
+        """Decide every tournament; the fittest contestant wins.
 
-    def _choose_two(self) -> int:
-        """Generate a random number representing the index of the chosen individual."""
-        return np.random.choice(np.arange(self.pop_size), size=2, replace=True)
+        Args:
+            contestants (np.ndarray of int): A (size, k) matrix of contestant indices.
+
+        Returns:
+            np.ndarray of int: Index of each tournament's winner.
+        """
+        scores = self.population_fitnesses[contestants]
+        best = np.argmax(scores, axis=1) if self.maximize else np.argmin(scores, axis=1)
+        return contestants[np.arange(len(contestants)), best]
 
-    def _compete(self, one:int, two:int) -> int:
-        """Head-to-head combat between two individuals.
+    @classmethod
+    def next_populations(cls, population_fitnesses:np.ndarray[np.float64], maximize:bool, rngs:list[np.random.Generator], **kwargs) -> np.ndarray[np.signedinteger]:
+        """Hold every tournament of many independent populations at once.
 
         Args:
-            one (int): Index of first contender.
-            one (int): Index of second contender.
+            population_fitnesses (np.ndarray of float): The (populations, pop_size) fitness matrix.
+            maximize (bool): (False)[minimize]; (True)[maximize].
+            rngs (list of np.random.Generator): Each population's source of randomness.
+            k (int, optional): The number of contestants in each tournament. Default 2.
 
         Returns:
-            int: Index of winner.
+            np.ndarray of int: A (populations, pop_size) matrix of each population's chosen indices.
         """
-        result = self.population_fitnesses[one] < self.population_fitnesses[two]
-        if self.maximize:
-            result = not result
-        if result:
-            return one
-        return two
+        assert int(kwargs.get('k', 2)) >= 1
+        k = int(kwargs.get('k', 2))
+        pop_size = population_fitnesses.shape[1]
+        contestants = np.stack([rng.integers(0, pop_size, size=(pop_size, k)) for rng in rngs])
+        return cls._compete_all(population_fitnesses, maximize, rngs, contestants, **kwargs)
+
+    @staticmethod
+    def _compete_all(population_fitnesses:np.ndarray[np.float64], maximize:bool, rngs:list[np.random.Generator], contestants:np.ndarray[np.signedinteger], **kwargs) -> np.ndarray[np.signedinteger]:
+        """Decide a (populations, size, k) tensor of tournaments; the fittest contestant wins."""
+        scores = _scores(population_fitnesses, contestants)
+        return _winners(scores, contestants, np.greater if maximize else np.less)
 
     @staticmethod
     def parameters() -> dict[str, tuple]:
-        return {}
+        return {'k': ('Enter Tournament Size', 2)}
 
 
 class StochasticTournament(DeterministicTournament):
     """Facilitates stochastic tournament selection.
 
     Attributes:
-        population_fitnesses (tuple of float): The population fitness scores, in order.
+        population_fitnesses (np.ndarray of float): The population fitness scores, in order.
         sum_of_fitnesses (float): The sum of the populations' fitness scores.
         maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
         pop_size (int): The size of the population.
+        rng (np.random.Generator): Source of randomness.
+        k (int): The number of contestants in each tournament.
         prob (float): The probability that the fittest individual wins the round.
     """
-    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, **kwargs) -> None:
+    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, rng:np.random.Generator=None, **kwargs) -> None:
         """
         Initialize the parameters for stochastic tournament selection.
 
@@ -87,31 +125,67 @@ class StochasticTournament(DeterministicTournament):
             population_fitnesses (tuple of float): The population fitness scores, in order.
             sum_of_fitnesses (float): The sum of the populations' fitness scores.
             maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
+            rng (np.random.Generator, optional): Source of randomness. Defaults to a fresh, unseeded Generator.
+            k (int, optional): The number of contestants in each tournament. Default 2.
             prob (float): The probability that the fittest individual wins the round.
         """
-        super().__init__(population_fitnesses, sum_of_fitnesses, maximize, **kwargs)
+        super().__init__(population_fitnesses, sum_of_fitnesses, maximize, rng, **kwargs)
         assert 'prob' in kwargs.keys() and kwargs['prob'] > 0 and kwargs['prob'] < 1
         self.prob = kwargs['prob']
 
-    def _compete(self, one:int, two:int) -> int:
-        """Head-to-head combat between two individuals with a chance that the loser wins.
+    def _compete(self, contestants:np.ndarray[np.signedinteger]) -> np.ndarray[np.signedinteger]:
+        """Decide every tournament with a chance of an upset, in which the least fit contestant wins.
 
         Args:
-            one (int): Index of first contender.
-            one (int): Index of second contender.
+            contestants (np.ndarray of int): A (size, k) matrix of contestant indices.
 
         Returns:
-            int: Index of winner.
+            np.ndarray of int: Index of each tournament's winner.
         """
-        result = self.population_fitnesses[one] < self.population_fitnesses[two]
-        if np.random.uniform(0, 1) > self.prob:
-            result = not result
-        if self.maximize:
-            result = not result
-        if result:
-            return one
-        return two
+        scores = self.population_fitnesses[contestants]
+        upset = self.rng.uniform(0, 1, size=len(contestants)) > self.prob
+        best = np.argmax(scores, axis=1) if self.maximize else np.argmin(scores, axis=1)
+        worst = np.argmin(scores, axis=1) if self.maximize else np.argmax(scores, axis=1)
+        return contestants[np.arange(len(contestants)), np.where(upset, worst, best)]
+
+    @staticmethod
+    def _compete_all(population_fitnesses:np.ndarray[np.float64], maximize:bool, rngs:list[np.random.Generator], contestants:np.ndarray[np.signedinteger], **kwargs) -> np.ndarray[np.signedinteger]:
+        """Decide a (populations, size, k) tensor of tournaments, each with a chance of an upset."""
+        assert 'prob' in kwargs.keys() and kwargs['prob'] > 0 and kwargs['prob'] < 1
+        scores = _scores(population_fitnesses, contestants)
+        upset = np.stack([rng.uniform(0, 1, size=contestants.shape[1]) for rng in rngs]) > kwargs['prob']
+        best = _winners(scores, contestants, np.greater if maximize else np.less)
+        worst = _winners(scores, contestants, np.less if maximize else np.greater)
+        return np.where(upset, worst, best)
 
     @staticmethod
     def parameters() -> dict[str, tuple]:
-        return {'prob': ('Enter Probability of Fittest Winner', 0.9)}
+        return {**DeterministicTournament.parameters(), 'prob': ('Enter Probability of Fittest Winner', 0.9)}
+
+
+def _scores(population_fitnesses:np.ndarray[np.float64], contestants:np.ndarray[np.signedinteger]) -> np.ndarray[np.float64]:
+    """Look up every contestant's score in its own population's row of the fitness matrix."""
+    offsets = np.arange(len(contestants)) * population_fitnesses.shape[1]
+    return population_fitnesses.ravel()[contestants + offsets[:, np.newaxis, np.newaxis]]
+
+
+def _winners(scores:np.ndarray[np.float64], contestants:np.ndarray[np.signedinteger], beats:np.ufunc) -> np.ndarray[np.signedinteger]:
+    """Keep a running winner across the k contestant columns.
+
+    This matches np.argmax/np.argmin (the first of tied contestants wins) but stays fast when k is small,
+    where a reduction along the short last axis is slow.
+
+    Args:
+        scores (np.ndarray of float): A (populations, size, k) tensor of contestant scores.
+        contestants (np.ndarray of int): The matching (populations, size, k) tensor of contestant indices.
+        beats (np.ufunc): np.greater to find the fittest when maximizing, np.less when minimizing.
+
+    Returns:
+        np.ndarray of int: A (populations, size) matrix of each tournament's winner.
+    """
+    winner, winning = contestants[..., 0], scores[..., 0]
+    for j in np.arange(1, contestants.shape[2]):
+        better = beats(scores[..., j], winning)
+        winner = np.where(better, contestants[..., j], winner)
+        winning = np.where(better, scores[..., j], winning)
+    return winner
@@ -13,57 +13,90 @@ class Truncation(SelectionMechanism):
         sum_of_fitnesses (float): The sum of the populations' fitness scores.
         maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
         pop_size (int): The size of the population.
+        rng (np.random.Generator): Source of randomness.
     """
-    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, **kwargs) -> None:
+    def __init__(self, population_fitnesses:tuple[float], sum_of_fitnesses:float=None, maximize:bool=True, rng:np.random.Generator=None, **kwargs) -> None:
         """Initialize the parameters for truncation selection with replacement.
 
         Args:
             population_fitnesses (tuple of float): The population fitness scores, in order.
             sum_of_fitnesses (float): The sum of the populations' fitness scores.
             maximize (bool): (False)[minimize]; (True)[maximize]. Default True.
+            rng (np.random.Generator, optional): Source of randomness. Defaults to a fresh, unseeded Generator.
             tao (float): The cut-line. i.e., Select only from top tao%. 
         """
         assert population_fitnesses is not None
         assert 'tao' in kwargs.keys() and type(kwargs['tao']) is float and kwargs['tao'] > 0 and kwargs['tao'] < 1
-        self.population_fitnesses = population_fitnesses
+        self.population_fitnesses = np.asarray(population_fitnesses, dtype=np.float64)
         self.sum_of_fitnesses = sum_of_fitnesses
         self.maximize = maximize
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.tao = kwargs['tao']
         if self.sum_of_fitnesses is None:
-            self.sum_of_fitnesses = sum(population_fitnesses)
+            self.sum_of_fitnesses = np.sum(population_fitnesses)
         self.pop_size = len(self.population_fitnesses)
 
-    def next_population(self) -> tuple[int]:
+    def next_population(self, size:int=None) -> tuple[int]:
         """Perform truncation selection on the population.
 
+        Args:
+            size (int, optional): Number of individuals to select. Defaults to pop_size.
+
         Returns:
             tuple of int: An index-defined population after a round of truncation selection.
         """
-        return self._sample_from_top_tao(self._generate_top_tao())
+        return self._sample_from_top_tao(self._generate_top_tao(), self.pop_size if size is None else int(size))
 
-    def _generate_top_tao(self) -> list[tuple]:
+    def _generate_top_tao(self) -> np.ndarray[np.signedinteger]:
         """Generate a pool of members for reproduction based on top tao% fitness scores.
 
+        The pool is found with a partial sort, which is O(pop_size); its order is unspecified.
+
         Returns:
-            list of tuple: A non-population-sized list containing respective indices and fitness scores.
+            np.ndarray of int: A non-population-sized array containing indices of the top tao% members.
         """
-        # TODO: numpy-ify this
         assert self.sum_of_fitnesses > 0
-        sorted_keep_indices = [(i, f) for i, f in enumerate(self.population_fitnesses)]
-        sorted_keep_indices.sort(key=lambda x:x[1], reverse=self.maximize)
-        return [tt[0] for tt in sorted_keep_indices[:int(self.pop_size * self.tao)]]
+        keep = max(1, int(self.pop_size * self.tao))
+        ordered = -self.population_fitnesses if self.maximize else self.population_fitnesses
+        if keep == self.pop_size:
+            return np.arange(self.pop_size)
+        return np.argpartition(ordered, keep - 1)[:keep]
 
-    def _sample_from_top_tao(self, top_tao:list[tuple]) -> tuple[int]:
+    def _sample_from_top_tao(self, top_tao:np.ndarray[np.signedinteger], size:int) -> np.ndarray[np.signedinteger]:
         """Generate a new index-defined population by stochastic choice based on the given members.
 
         Args:
-            top_tao (list of tuple): Pool of members available for sampling.
+            top_tao (np.ndarray of int): Pool of members available for sampling.
+            size (int): Number of individuals to choose.
+
+        Returns:
+            np.ndarray of int: A size-length array containing indices of chosen individuals.
+        """
+        return self.rng.choice(top_tao, size=size, replace=True)
+
+    @classmethod
+    def next_populations(cls, population_fitnesses:np.ndarray[np.float64], maximize:bool, rngs:list[np.random.Generator], **kwargs) -> np.ndarray[np.signedinteger]:
+        """Perform truncation selection on many independent populations at once.
+
+        Args:
+            population_fitnesses (np.ndarray of float): The (populations, pop_size) fitness matrix.
+            maximize (bool): (False)[minimize]; (True)[maximize].
+            rngs (list of np.random.Generator): Each population's source of randomness.
+            tao (float): The cut-line. i.e., Select only from top tao%.
 
         Returns:
-            tuple of int: A population-sized list containing indices of chosen individuals.
+            np.ndarray of int: A (populations, pop_size) matrix of each population's chosen indices.
         """
-        return np.random.choice(top_tao, size=self.pop_size, replace=True)
+        assert 'tao' in kwargs.keys() and type(kwargs['tao']) is float and kwargs['tao'] > 0 and kwargs['tao'] < 1
+        assert np.all(np.sum(population_fitnesses, axis=1) > 0)
+        pop_size = population_fitnesses.shape[1]
+        keep = max(1, int(pop_size * kwargs['tao']))
+        ordered = -population_fitnesses if maximize else population_fitnesses
+        top_tao = np.argpartition(ordered, keep - 1, axis=1)[:, :keep] if keep < pop_size else np.broadcast_to(np.arange(pop_size), ordered.shape)
+        # rng.choice(top_tao, size) draws positions in top_tao with rng.integers
+        positions = np.stack([rng.integers(0, keep, size=pop_size) for rng in rngs])
+        return np.take_along_axis(top_tao, positions, axis=1)
 
     @staticmethod
     def parameters() -> dict[str, tuple]:
-        return {'tao': ('Enter Tao (top percent cut-line)', 0.4)}
\ No newline at end of file
+        return {'tao': ('Enter Tao (top percent cut-line)', 0.4)}
@@ -0,0 +1,171 @@
+# ahester57
+
+import csv
+import itertools
+import json
+import numpy as np
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator
+
+import evolution_program.references as references
+from evolution_program.ga import GA
+from evolution_program.selection_mechanism import MECHANISMS, default_parameters
+
+
+# GA arguments given as names or 'module:qualname' references rather than objects
+_REFERENCES = ('fitness_function', 'Select_Mechanism', 'Evaluator')
+
+
+def expand_grid(config:dict) -> list[dict]:
+    """Expand a sweep configuration into one set of GA arguments per run.
+
+    Every list-valued argument is a grid axis; the runs are the cartesian product of the axes,
+    in order, with the last axis varying fastest. 'seeds' is an alias for rand_seed.
+    'selection_parameters' may map mechanism names to their parameters, merged over each mechanism's defaults
+    and converted to the types of the defaults by resolve.
+
+    Args:
+        config (dict): GA arguments, with lists for the values to sweep over.
+
+    Returns:
+        list of dict: The configuration of each run, with references still given by name.
+    """
+    config = dict(config)
+    if 'seeds' in config:
+        config['rand_seed'] = config.pop('seeds')
+    axes = {k: v for k, v in config.items() if isinstance(v, list)}
+    fixed = {k: v for k, v in config.items() if not isinstance(v, list)}
+    return [{**fixed, **dict(zip(axes, values))} for values in itertools.product(*axes.values())]
+
+
+def resolve(run:dict) -> dict:
+    """Turn one run's configuration into GA keyword arguments.
+
+    Args:
+        run (dict): A configuration from expand_grid.
+
+    Returns:
+        dict: Keyword arguments for GA, with mechanism names and references resolved,
+        and selection parameters converted to the types of the mechanism's defaults (e.g. 2 to 2.0).
+    """
+    kwargs = dict(run)
+    for key in _REFERENCES:
+        if isinstance(kwargs.get(key), str):
+            name = kwargs[key]
+            kwargs[key] = MECHANISMS[name] if key == 'Select_Mechanism' and name in MECHANISMS else references.resolve(name)
+    Select_Mechanism = kwargs.get('Select_Mechanism', MECHANISMS['proportional'])
+    parameters = kwargs.get('selection_parameters') or {}
+    if len(parameters) > 0 and all(isinstance(v, dict) for v in parameters.values()):
+        # parameters given per mechanism name
+        parameters = parameters.get(run.get('Select_Mechanism', 'proportional'), {})
+    defaults = default_parameters(Select_Mechanism)
+    kwargs['selection_parameters'] = {**defaults, **{k: _coerce(k, v, defaults.get(k)) for k, v in parameters.items()}}
+    for key in ('history_path', 'checkpoint_path'):
+        if isinstance(kwargs.get(key), str):
+            kwargs[key] = kwargs[key].format(**{k: v for k, v in run.items() if not isinstance(v, dict)})
+    return kwargs
+
+
+def _coerce(name:str, value, default):
+    """Convert a selection parameter read from TOML, JSON or a flag to the type of its default, e.g. max = 2 to 2.0."""
+    if default is None or type(value) is type(default):
+        return value
+    if type(default) is int and isinstance(value, float) and not value.is_integer():
+        raise ValueError(f'selection parameter {name!r} must be a whole number, not {value!r}')
+    if type(default) in (int, float) and isinstance(value, bool):
+        raise ValueError(f'selection parameter {name!r} must be a number, not {value!r}')
+    try:
+        return type(default)(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'selection parameter {name!r} must be a {type(default).__name__}, not {value!r}') from None
+
+
+def run_one(run:dict) -> dict:
+    """Simulate one configuration quietly and summarize it as a results row.
+
+    Args:
+        run (dict): A configuration from expand_grid, plus its 'run' index.
+
+    Returns:
+        dict: The run's swept arguments, stop reason, generations, evaluations, best fitness and alleles, and wall time.
+    """
+    run = dict(run)
+    index = run.pop('run')
+    ga = GA(**{**resolve(run), 'verbose': False})
+    start = time.perf_counter()
+    ga.simulate()
+    stats = ga.population.statistics
+    best = stats.argmax if ga.maximize else stats.argmin
+    return {
+        'run': index,
+        **{k: v for k, v in run.items() if not isinstance(v, dict)},
+        'rand_seed': ga.rand_seed,
+        'stop_reason': ga.stop_reason,
+        'generations': ga.t,
+        'evaluations': ga.evaluations,
+        'best_fitness': float(ga.population.fitnesses[best]),
+        'mean_fitness': float(stats.mean),
+        'best_alleles': ga.population.alleles[best].tolist(),
+        'seconds': time.perf_counter() - start
+    }
+
+
+def run_sweep(runs:list[dict], workers:int=None) -> Iterator[dict]:
+    """Simulate every configuration, across a pool of worker processes.
+
+    Args:
+        runs (list of dict): Configurations from expand_grid.
+        workers (int, optional): Number of worker processes. 1 runs in this process. Defaults to the CPU count.
+
+    Yields:
+        dict: One results row per run, in order of completion.
+    """
+    workers = int(workers or os.cpu_count() or 1)
+    indexed = [{'run': i, **run} for i, run in enumerate(runs)]
+    if workers == 1:
+        yield from (run_one(run) for run in indexed)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_one, run) for run in indexed]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+class ResultsWriter:
+    """Writes results rows as JSON lines, or as CSV when the path ends in .csv."""
+    def __init__(self, path:str=None) -> None:
+        """Open the results file.
+
+        Args:
+            path (str, optional): Destination file. Defaults to JSON lines on standard output.
+        """
+        self._file = None if path is None else open(path, 'w', newline='')
+        self._csv = path is not None and path.endswith('.csv')
+        self._writer = None
+
+    def write(self, row:dict) -> None:
+        row = {k: _plain(v) for k, v in row.items()}
+        if not self._csv:
+            print(json.dumps(row), file=self._file, flush=True)
+            return
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(row), extrasaction='ignore')
+            self._writer.writeheader()
+        self._writer.writerow({k: json.dumps(v) if isinstance(v, list) else v for k, v in row.items()})
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def _plain(value):
+    """A JSON-friendly version of a results value."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, type) or callable(value):
+        return references.reference(value)
+    return value
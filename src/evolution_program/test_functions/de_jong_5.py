@@ -2,21 +2,34 @@
 
 import numpy as np
 
+from evolution_program.fitness import DTYPES, as_float_array, batch
 
+
+# Foxhole coordinates, one column per foxhole
+A = np.zeros([2, 25])
+A[0] = np.tile([-32, -16, 0, 16, 32], (1, 5))
+A[1] = np.repeat([-32, -16, 0, 16, 32], 5)
+_I = np.arange(25)
+# The constants in each allele dtype, so float32 alleles are scored in float32
+_CONSTANTS = {dtype: (A.astype(dtype), _I.astype(dtype)) for dtype in DTYPES}
+
+
+def _power_6(d:np.ndarray[np.float64]) -> np.ndarray[np.float64]:
+    # repeated squaring is several times faster than np.power with a float exponent
+    d3 = d * d * d
+    return d3 * d3
+
+
+@batch
 def fn(alleles:np.ndarray[np.float64]):
-    A = np.zeros([2, 25])
-    a = [-32, -16, 0, 16, 32]
-    A[0] = np.tile(a, (1, 5))
-    A[1] = np.repeat(a, 5)
-    sum = 0
-    for i in np.arange(25):
-        a0i = A[0, i]
-        a1i = A[1, i]
-        t2 = np.power((alleles[0] - a0i), 6)
-        t3 = np.power((alleles[1] - a1i), 6)
-        new = np.divide(1, (i + t2 + t3))
-        sum = sum + new
-    return np.divide(1, (0.002 + sum))
+    x = as_float_array(alleles)
+    a, i = _CONSTANTS[x.dtype]
+    X = np.atleast_2d(x)
+    t2 = _power_6(X[:, 0, np.newaxis] - a[0])
+    t3 = _power_6(X[:, 1, np.newaxis] - a[1])
+    sum = np.sum(np.divide(1, (i + t2 + t3)), axis=1)
+    f = np.divide(1, (0.002 + sum))
+    return f if x.ndim == 2 else f[0]
 
 
 if __name__ == '__main__':
@@ -2,9 +2,12 @@
 
 import numpy as np
 
+from evolution_program.fitness import as_float_array, batch
 
+
+@batch
 def fn(alleles:np.ndarray[np.float64]):
-    return np.sum(np.square(alleles))
+    return np.sum(np.square(as_float_array(alleles)), axis=-1)
 
 
 if __name__ == '__main__':
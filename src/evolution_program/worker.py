@@ -0,0 +1,117 @@
+# ahester57
+
+import argparse
+import socket
+import socketserver
+
+import evolution_program.evaluation.protocol as protocol
+import evolution_program.fitness as fitness
+import evolution_program.references as references
+
+
+# Modules whose fitness functions a worker serves unless told otherwise
+DEFAULT_MODULES = ('evolution_program.test_functions',)
+
+# Largest frame a worker accepts by default, in bytes; a longer one closes the connection unread
+DEFAULT_MAX_FRAME = 256 * 2**20
+
+
+def _within(module:str, modules:tuple[str]) -> bool:
+    return any(module == m or module.startswith(m + '.') for m in modules)
+
+
+def resolve_allowed(ref:str, modules:tuple[str]) -> object:
+    """Resolve a fitness function reference sent by a coordinator, refusing any outside the allowed modules.
+
+    Both the reference and the object it names must belong to one of the modules (or their submodules),
+    so a peer can neither import other modules nor reach objects they import, such as os.system.
+
+    Args:
+        ref (str): A 'module:qualname' reference.
+        modules (tuple of str): The allowed modules and packages.
+
+    Returns:
+        object: The named function or class.
+    """
+    module = ref.partition(':')[0]
+    if not _within(module, modules):
+        raise PermissionError(f'{module!r} is not an allowed module')
+    obj = references.resolve(ref)
+    if not _within(getattr(obj, '__module__', None) or '', modules):
+        raise PermissionError(f'{ref!r} is not defined in an allowed module')
+    return obj
+
+
+class _EvaluationHandler(socketserver.BaseRequestHandler):
+    """Serves one coordinator connection: a HELLO naming the fitness function, then any number of EVALUATE frames."""
+    def handle(self) -> None:
+        sock : socket.socket = self.request
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        fitness_function = None
+        while True:
+            try:
+                kind, payload = protocol.recv_frame(sock, self.server.max_frame)
+            except ConnectionError:
+                return
+            try:
+                if kind == protocol.HELLO:
+                    fitness_function = resolve_allowed(payload.decode('utf-8'), self.server.modules)
+                    assert callable(fitness_function), f'{payload!r} is not callable'
+                    protocol.send_frame(sock, protocol.OK)
+                elif kind == protocol.EVALUATE:
+                    assert fitness_function is not None, 'EVALUATE before HELLO'
+                    scores = fitness.evaluate(fitness_function, protocol.unpack_matrix(payload))
+                    protocol.send_frame(sock, protocol.RESULT, protocol.pack_vector(scores))
+                else:
+                    raise ValueError(f'unexpected frame {kind!r}')
+            except ConnectionError:
+                return
+            except Exception as e:
+                protocol.send_frame(sock, protocol.ERROR, f'{type(e).__name__}: {e}'.encode('utf-8'))
+
+
+class WorkerServer(socketserver.ThreadingTCPServer):
+    """Listens for coordinators (see evaluation.tcp.TCPEvaluator) and scores the allele chunks they send.
+
+    Connections are not authenticated, so a worker only listens on the loopback interface unless given a host,
+    only serves fitness functions defined in its allowed modules, and drops any connection announcing a frame
+    longer than max_frame before allocating room for it.
+
+    Attributes:
+        modules (tuple of str): Modules and packages whose fitness functions may be requested.
+        max_frame (int): Largest frame payload accepted, in bytes.
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, host:str='127.0.0.1', port:int=5555, modules:tuple[str]=DEFAULT_MODULES, max_frame:int=DEFAULT_MAX_FRAME) -> None:
+        assert max_frame > 0
+        self.modules = tuple(modules)
+        self.max_frame = int(max_frame)
+        super().__init__((host, port), _EvaluationHandler)
+
+
+def main(argv:list[str]=None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m evolution_program.worker', description='Serve fitness evaluations to a TCPEvaluator.')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on; 0.0.0.0 for all of them, on a trusted network only. Default 127.0.0.1.')
+    parser.add_argument('--port', type=int, default=5555, help='Port to listen on; 0 picks a free one. Default 5555.')
+    parser.add_argument(
+        '--allow', metavar='MODULE', action='append',
+        help=f'Module or package whose fitness functions may be requested; repeatable. Default {",".join(DEFAULT_MODULES)}.'
+    )
+    parser.add_argument(
+        '--max-frame', type=int, default=DEFAULT_MAX_FRAME,
+        help=f'Largest frame accepted, in bytes; bounds the allele chunk size. Default {DEFAULT_MAX_FRAME}.'
+    )
+    args = parser.parse_args(argv)
+    with WorkerServer(args.host, args.port, args.allow or DEFAULT_MODULES, args.max_frame) as server:
+        host, port = server.server_address[:2]
+        print(f'Worker listening on {host}:{port}', flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()